@@ -0,0 +1,136 @@
+"""
+Time thread lookups with a fresh Gmail client per call against GmailClientPool.
+
+Loading the OAuth credentials and building the API resource are replaced by
+local fakes that sleep for a configurable time, and so is the request
+itself, so no Google account or network is needed. Run from the project
+root:
+
+    uv run python scripts/bench_gmail_clients.py --lookups 200 --threads 4
+"""
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from email_auto_responder_flow.utils.gmail_client import GmailClientPool
+
+
+class Counter:
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def increment(self):
+        with self._lock:
+            self.count += 1
+
+
+class FakeCredentials:
+    expired = False
+    refresh_token = None
+
+
+class FakeRequest:
+    def __init__(self, result: dict, seconds: float):
+        self._result = result
+        self._seconds = seconds
+
+    def execute(self) -> dict:
+        time.sleep(self._seconds)
+        return self._result
+
+
+class FakeGmailResource:
+    """Answers users().threads().get(...) like the Gmail API resource."""
+
+    def __init__(self, request_seconds: float):
+        self._request_seconds = request_seconds
+
+    def users(self):
+        return self
+
+    def threads(self):
+        return self
+
+    def get(self, userId: str, id: str) -> FakeRequest:
+        thread = {"id": id, "messages": [{"id": f"{id}-1", "snippet": "Hello"}]}
+        return FakeRequest(thread, self._request_seconds)
+
+
+class FakeBuilders:
+    def __init__(self, args):
+        self.args = args
+        self.credentials_loaded = Counter()
+        self.resources_built = Counter()
+
+    def build_credentials(self):
+        self.credentials_loaded.increment()
+        time.sleep(self.args.credentials_ms / 1000)
+        return FakeCredentials()
+
+    def build_resource(self, credentials):
+        self.resources_built.increment()
+        time.sleep(self.args.build_ms / 1000)
+        return FakeGmailResource(self.args.request_ms / 1000)
+
+
+def run(lookup, lookups: int, threads: int) -> float:
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(lookup, (f"thread-{number}" for number in range(lookups))))
+    return time.perf_counter() - started_at
+
+
+def report(label: str, builders: FakeBuilders, lookups: int, elapsed: float):
+    print(
+        f"{label:<16} credential loads={builders.credentials_loaded.count:<5} "
+        f"resources built={builders.resources_built.count:<5} "
+        f"wall={elapsed:.2f}s per lookup={elapsed / lookups * 1000:.2f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lookups", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument(
+        "--credentials-ms", type=float, default=20, help="time to load credentials"
+    )
+    parser.add_argument(
+        "--build-ms", type=float, default=30, help="time to build an API resource"
+    )
+    parser.add_argument(
+        "--request-ms", type=float, default=0, help="time of each API request"
+    )
+    args = parser.parse_args()
+
+    fresh = FakeBuilders(args)
+
+    def fresh_lookup(thread_id: str) -> dict:
+        credentials = fresh.build_credentials()
+        resource = fresh.build_resource(credentials=credentials)
+        return resource.users().threads().get(userId="me", id=thread_id).execute()
+
+    pooled = FakeBuilders(args)
+    pool = GmailClientPool(
+        build_credentials=pooled.build_credentials,
+        build_resource=pooled.build_resource,
+    )
+
+    def pooled_lookup(thread_id: str) -> dict:
+        resource = pool.api_resource()
+        return resource.users().threads().get(userId="me", id=thread_id).execute()
+
+    fresh_elapsed = run(fresh_lookup, args.lookups, args.threads)
+    pooled_elapsed = run(pooled_lookup, args.lookups, args.threads)
+
+    print(f"{args.lookups} thread lookups over {args.threads} threads")
+    report("fresh per call", fresh, args.lookups, fresh_elapsed)
+    report("GmailClientPool", pooled, args.lookups, pooled_elapsed)
+    print(f"Speedup: {fresh_elapsed / pooled_elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
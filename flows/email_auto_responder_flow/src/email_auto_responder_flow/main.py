@@ -1,48 +1,165 @@
 #!/usr/bin/env python
+import asyncio
+import functools
 import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
-from crewai.flow.flow import Flow, listen, start
+from crewai.flow.flow import Flow, start
 from pydantic import BaseModel
 
 from email_auto_responder_flow.types import Email
-from email_auto_responder_flow.utils.emails import check_email, format_emails
+from email_auto_responder_flow.utils.emails import format_emails
+from email_auto_responder_flow.utils.ingestion import (
+    AdaptiveBackoff,
+    EmailIngestor,
+    LatencyTracker,
+)
+from email_auto_responder_flow.utils.mailbox import GmailHistorySource, MailboxSource
+from email_auto_responder_flow.utils.seen_store import SeenStore
+from email_auto_responder_flow.utils.thread_cache import thread_cache
 
 from .crews.email_filter_crew.email_filter_crew import EmailFilterCrew
 
 
 class AutoResponderState(BaseModel):
+    # Flow state id, crewAI fills it in when it is empty
+    id: str = ""
     emails: List[Email] = []
-    checked_emails_ids: set[str] = set()
+    # Delay between checks while the inbox is idle, doubling up to the max
+    min_poll_seconds: float = 5
+    max_poll_seconds: float = 180
+    # Handled email ids and the Gmail sync cursor, kept across restarts
+    seen_store_path: str = "./seen_emails.db"
+    seen_ttl_days: float = 7
+    # Run one crew per email thread instead of one crew for the whole batch
+    per_thread_drafts: bool = False
+    max_concurrent_threads: int = 4
+    thread_timeout_seconds: float = 300
+    # Stop after this many batches, None keeps responding until stopped
+    max_batches: Optional[int] = None
 
 
 class EmailAutoResponderFlow(Flow[AutoResponderState]):
     initial_state = AutoResponderState
 
-    @start("wait_next_run")
-    def fetch_new_emails(self):
-        print("Kickoff the Email Filter Crew")
-        new_emails, updated_checked_email_ids = check_email(
-            checked_emails_ids=self.state.checked_emails_ids
+    def __init__(self, source: Optional[MailboxSource] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.source = source
+        self.latency = LatencyTracker()
+        self._crew_executor: Optional[ThreadPoolExecutor] = None
+        self._crew_slots: Optional[asyncio.Semaphore] = None
+
+    @start()
+    async def respond_to_emails(self):
+        """
+        Wait for each batch of new emails and draft the responses to it.
+
+        The loop stays in this one method. Routing back to a start method
+        would run every batch one listener deeper than the last, keeping the
+        task and the output of every earlier batch alive.
+        """
+        if self.source is None:
+            seen = SeenStore(
+                self.state.seen_store_path,
+                ttl_seconds=self.state.seen_ttl_days * 24 * 3600,
+            )
+            self.source = GmailHistorySource(seen)
+        ingestor = EmailIngestor(
+            self.source,
+            AdaptiveBackoff(self.state.min_poll_seconds, self.state.max_poll_seconds),
         )
 
-        self.state.emails = new_emails
-        self.state.checked_emails_ids = updated_checked_email_ids
+        # Crews run on their own threads, so crews still running after a
+        # timeout can't take the default executor threads ingestion uses
+        self._crew_executor = ThreadPoolExecutor(
+            self.state.max_concurrent_threads, thread_name_prefix="crew"
+        )
+        self._crew_slots = asyncio.Semaphore(self.state.max_concurrent_threads)
+        try:
+            batches = 0
+            while self.state.max_batches is None or batches < self.state.max_batches:
+                print("Waiting for new emails")
+                self.state.emails = await ingestor.next_batch()
+                await self.generate_draft_responses()
+                batches += 1
+        finally:
+            self._crew_executor.shutdown(wait=False)
+
+    async def run_crew(self, emails: List[dict], timeout: Optional[float] = None):
+        """
+        Run an EmailFilterCrew over `emails` on the crew threads.
+
+        The crew takes a slot before it starts and gives it back only when
+        its thread finishes. A crew that times out keeps running, and keeps
+        counting against `max_concurrent_threads` until it stops.
+        """
+        crew = EmailFilterCrew().crew()
+        await self._crew_slots.acquire()
+        running = asyncio.get_running_loop().run_in_executor(
+            self._crew_executor,
+            functools.partial(crew.kickoff, inputs={"emails": format_emails(emails)}),
+        )
+        running.add_done_callback(lambda _: self._crew_slots.release())
+        # Shielded, so a timeout stops the wait without marking the crew done
+        await asyncio.wait_for(asyncio.shield(running), timeout)
+
+    async def draft_thread(self, thread_id, emails):
+        started_at = time.monotonic()
+        # After a timeout the flow stops waiting for the crew and moves on to
+        # the other threads
+        await self.run_crew(emails, timeout=self.state.thread_timeout_seconds)
+        elapsed = time.monotonic() - started_at
+
+        print(f"Drafted thread {thread_id} in {elapsed:.1f}s")
+        return emails
+
+    async def draft_per_thread(self):
+        threads = {}
+        for email in self.state.emails:
+            threads.setdefault(email["threadId"], []).append(email)
+
+        results = await asyncio.gather(
+            *(
+                self.draft_thread(thread_id, emails)
+                for thread_id, emails in threads.items()
+            ),
+            return_exceptions=True,
+        )
 
-    @listen(fetch_new_emails)
-    def generate_draft_responses(self):
+        drafted = []
+        for thread_id, result in zip(threads, results):
+            if isinstance(result, asyncio.TimeoutError):
+                print(
+                    f"Timed out drafting thread {thread_id} after "
+                    f"{self.state.thread_timeout_seconds:.0f}s"
+                )
+            elif isinstance(result, BaseException):
+                print(f"Failed to draft thread {thread_id}: {result}")
+            else:
+                drafted.extend(result)
+        print(f"Drafted {len(drafted)} of {len(self.state.emails)} emails")
+        return drafted
+
+    async def generate_draft_responses(self):
         print("Current email queue: ", len(self.state.emails))
         if len(self.state.emails) > 0:
             print("Writing New emails")
-            emails = format_emails(self.state.emails)
-
-            EmailFilterCrew().crew().kickoff(inputs={"emails": emails})
-
+            if self.state.per_thread_drafts:
+                drafted = await self.draft_per_thread()
+            else:
+                await self.run_crew(self.state.emails)
+                drafted = self.state.emails
+
+            self.latency.record(drafted)
+            if len(self.latency) > 0:
+                print(
+                    f"Median response latency: {self.latency.median():.1f}s "
+                    f"over the last {len(self.latency)} emails"
+                )
+            print("Thread cache:", thread_cache.summary())
             self.state.emails = []
 
-        print("Waiting for 180 seconds")
-        time.sleep(180)
-
 
 def kickoff():
     """
@@ -1,7 +1,8 @@
 from langchain.tools import tool
-from langchain_community.agent_toolkits import GmailToolkit
 from langchain_community.tools.gmail.create_draft import GmailCreateDraft
 
+from email_auto_responder_flow.utils.gmail_client import gmail_clients
+
 
 class CreateDraftTool:
     @tool("Create Draft")
@@ -14,7 +15,6 @@ class CreateDraftTool:
         For example, `lorem@ipsum.com|Nice To Meet You|Hey it was great to meet you.`.
         """
         email, subject, message = data.split("|")
-        gmail = GmailToolkit()
-        draft = GmailCreateDraft(api_resource=gmail.api_resource)
+        draft = GmailCreateDraft(api_resource=gmail_clients.api_resource())
         result = draft({"to": [email], "subject": subject, "message": message})
         return f"\nDraft created: {result}\n"
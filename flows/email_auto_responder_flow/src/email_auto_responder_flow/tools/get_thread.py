@@ -0,0 +1,39 @@
+from typing import Dict, Optional
+
+from langchain_core.callbacks import CallbackManagerForToolRun
+from langchain_community.tools.gmail.get_thread import GmailGetThread
+
+from email_auto_responder_flow.utils.gmail_client import gmail_clients
+from email_auto_responder_flow.utils.thread_cache import thread_cache
+
+
+class CachedGmailGetThread(GmailGetThread):
+    """
+    GmailGetThread that answers from the process-wide thread cache, and
+    otherwise looks the thread up with the calling thread's pooled Gmail
+    client, so crews running in parallel never share a client.
+    """
+
+    def _run(
+        self,
+        thread_id: str,
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+    ) -> Dict:
+        thread_data = thread_cache.get(thread_id)
+        if thread_data is not None:
+            return thread_data
+
+        query = (
+            gmail_clients.api_resource()
+            .users()
+            .threads()
+            .get(userId="me", id=thread_id)
+        )
+        thread_data = query.execute()
+        messages = thread_data["messages"]
+        thread_data["messages"] = [
+            {"id": message["id"], "snippet": message["snippet"]}
+            for message in messages
+        ]
+        thread_cache.put(thread_id, thread_data)
+        return thread_data
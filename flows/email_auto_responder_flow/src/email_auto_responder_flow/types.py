@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -6,3 +8,5 @@ class Email(BaseModel):
     threadId: str
     snippet: str
     sender: str
+    # Unix time the email arrived, used to measure response latency
+    received_at: Optional[float] = None
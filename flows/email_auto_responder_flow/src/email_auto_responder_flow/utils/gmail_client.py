@@ -0,0 +1,48 @@
+import threading
+from typing import Callable
+
+from google.auth.transport.requests import Request
+from langchain_community.tools.gmail.utils import (
+    build_resource_service,
+    get_gmail_credentials,
+)
+
+
+class GmailClientPool:
+    """
+    Process-wide Gmail API clients, shared by ingestion, the tools and agents.
+
+    The OAuth credentials are loaded once and refreshed under a lock when they
+    expire. The API resource built from them is not thread-safe, so each
+    thread builds its own on first use and reuses it after that.
+    """
+
+    def __init__(
+        self,
+        build_credentials: Callable = get_gmail_credentials,
+        build_resource: Callable = build_resource_service,
+    ):
+        self._build_credentials = build_credentials
+        self._build_resource = build_resource
+        self._credentials = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def credentials(self):
+        with self._lock:
+            if self._credentials is None:
+                self._credentials = self._build_credentials()
+            elif self._credentials.expired and self._credentials.refresh_token:
+                self._credentials.refresh(Request())
+            return self._credentials
+
+    def api_resource(self):
+        credentials = self.credentials()
+        resource = getattr(self._local, "resource", None)
+        if resource is None:
+            resource = self._build_resource(credentials=credentials)
+            self._local.resource = resource
+        return resource
+
+
+gmail_clients = GmailClientPool()
@@ -0,0 +1,77 @@
+import asyncio
+import statistics
+import time
+from collections import deque
+from typing import List, Optional
+
+from email_auto_responder_flow.utils.mailbox import MailboxSource
+
+
+class AdaptiveBackoff:
+    """
+    Poll delay that grows while the inbox is idle and resets when mail arrives.
+    """
+
+    def __init__(self, min_delay: float, max_delay: float, factor: float = 2.0):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self._delay = min_delay
+
+    def reset(self):
+        self._delay = self.min_delay
+
+    def next_delay(self) -> float:
+        delay = self._delay
+        self._delay = min(self._delay * self.factor, self.max_delay)
+        return delay
+
+
+class EmailIngestor:
+    """
+    Waits for the next batch of new emails from a mailbox source.
+
+    The source is checked right away, then again with an adaptive backoff
+    while it stays empty. The wait is awaited on the event loop, so no thread
+    is held while the inbox is idle.
+    """
+
+    def __init__(self, source: MailboxSource, backoff: AdaptiveBackoff):
+        self.source = source
+        self.backoff = backoff
+
+    async def next_batch(self) -> List[dict]:
+        while True:
+            emails = await asyncio.to_thread(self.source.fetch_new_emails)
+            if emails:
+                self.backoff.reset()
+                detected_at = time.time()
+                for email in emails:
+                    # Sources that don't know the arrival time count from now
+                    if email.get("received_at") is None:
+                        email["received_at"] = detected_at
+                return emails
+
+            delay = self.backoff.next_delay()
+            print(f"## No new emails, checking again in up to {delay:.0f}s")
+            await self.source.wait_for_mail(delay)
+
+
+class LatencyTracker:
+    """
+    Response latency, from an email's arrival to its draft, over recent emails.
+    """
+
+    def __init__(self, window: int = 1000):
+        self._latencies = deque(maxlen=window)
+
+    def __len__(self):
+        return len(self._latencies)
+
+    def record(self, emails: List[dict]):
+        finished_at = time.time()
+        for email in emails:
+            self._latencies.append(finished_at - email["received_at"])
+
+    def median(self) -> Optional[float]:
+        return statistics.median(self._latencies) if self._latencies else None
@@ -0,0 +1,196 @@
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+from googleapiclient.errors import HttpError
+
+from email_auto_responder_flow.types import Email
+from email_auto_responder_flow.utils.emails import is_from_me, message_to_email
+from email_auto_responder_flow.utils.gmail_client import gmail_clients
+from email_auto_responder_flow.utils.seen_store import SeenStore
+from email_auto_responder_flow.utils.thread_cache import thread_cache
+
+HISTORY_CURSOR = "gmail_history_id"
+
+
+class MailboxSource(ABC):
+    """
+    Where the flow gets its new emails from.
+
+    `fetch_new_emails` returns the emails that arrived since the last call and
+    runs on a worker thread. `wait_for_mail` is awaited between empty fetches
+    and may return early when the source knows new mail has arrived.
+    """
+
+    @abstractmethod
+    def fetch_new_emails(self) -> List[dict]:
+        """Return the emails that arrived since the last call."""
+
+    async def wait_for_mail(self, timeout: float):
+        await asyncio.sleep(timeout)
+
+
+class GmailHistorySource(MailboxSource):
+    """
+    Fetches only the messages added to the inbox since the last sync.
+
+    The Gmail history id of the last sync is kept as a cursor in the seen
+    store, so each check costs one history call when the inbox is idle. The
+    first sync, and any sync whose cursor Gmail no longer keeps, backfills
+    with a search instead of replaying the history. Every thread that got a
+    new message is invalidated in the thread cache.
+    """
+
+    def __init__(self, seen: SeenStore, backfill_query: str = "newer_than:1d"):
+        self.seen = seen
+        self.backfill_query = backfill_query
+
+    @property
+    def api_resource(self):
+        # Checks run on worker threads, each one uses its own pooled client
+        return gmail_clients.api_resource()
+
+    def fetch_new_emails(self) -> List[dict]:
+        messages = None
+        history_id = self.seen.get_cursor(HISTORY_CURSOR)
+        if history_id is not None:
+            messages, latest_history_id = self._added_since(history_id)
+        if messages is None:
+            messages, latest_history_id = self._backfill()
+
+        for message in messages:
+            thread_cache.invalidate(
+                message["threadId"], message.get("historyId", latest_history_id)
+            )
+
+        message_ids = list(dict.fromkeys(message["id"] for message in messages))
+        unseen = self.seen.unseen(message_ids)
+        threads = set()
+        new_emails: List[dict] = []
+        for message_id in message_ids:
+            if message_id not in unseen:
+                continue
+            email = self._get_email(message_id)
+            if email is None or email["threadId"] in threads or is_from_me(email):
+                continue
+            threads.add(email["threadId"])
+            new_emails.append(email)
+
+        self.seen.add(message_ids)
+        self.seen.set_cursor(HISTORY_CURSOR, latest_history_id)
+        return new_emails
+
+    def _added_since(self, history_id: str) -> Tuple[Optional[List[dict]], str]:
+        messages = []
+        page_token = None
+        try:
+            while True:
+                response = (
+                    self.api_resource.users()
+                    .history()
+                    .list(
+                        userId="me",
+                        startHistoryId=history_id,
+                        historyTypes=["messageAdded"],
+                        labelId="INBOX",
+                        pageToken=page_token,
+                    )
+                    .execute()
+                )
+                for record in response.get("history", []):
+                    for added in record.get("messagesAdded", []):
+                        # The record's id is the history id the thread changed at
+                        messages.append({**added["message"], "historyId": record["id"]})
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    return messages, response["historyId"]
+        except HttpError as error:
+            # Gmail only keeps about a week of history
+            if error.resp.status == 404:
+                print("## Gmail history cursor expired, resyncing")
+                return None, history_id
+            raise
+
+    def _backfill(self) -> Tuple[List[dict], str]:
+        # Read the cursor first so mail arriving during the search isn't missed
+        profile = self.api_resource.users().getProfile(userId="me").execute()
+        messages = []
+        page_token = None
+        while True:
+            response = (
+                self.api_resource.users()
+                .messages()
+                .list(userId="me", q=self.backfill_query, pageToken=page_token)
+                .execute()
+            )
+            messages.extend(response.get("messages", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return messages, profile["historyId"]
+
+    def _get_email(self, message_id: str) -> Optional[dict]:
+        try:
+            message = (
+                self.api_resource.users()
+                .messages()
+                .get(
+                    userId="me",
+                    id=message_id,
+                    format="metadata",
+                    metadataHeaders=["From"],
+                )
+                .execute()
+            )
+        except HttpError as error:
+            # The message was deleted between the sync and this lookup
+            if error.resp.status == 404:
+                return None
+            raise
+        return message_to_email(message)
+
+
+class LocalMailbox(MailboxSource):
+    """
+    In-memory stand-in for Gmail, for running the flow without an account.
+
+    `deliver` can be called from any thread and wakes a waiting flow right
+    away, so the flow picks the email up without waiting for the next poll.
+    """
+
+    def __init__(self):
+        self._inbox: List[dict] = []
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._new_mail: Optional[asyncio.Event] = None
+
+    def deliver(self, email: Email):
+        message = email.model_dump()
+        if message["received_at"] is None:
+            message["received_at"] = time.time()
+        with self._lock:
+            self._inbox.append(message)
+            loop, new_mail = self._loop, self._new_mail
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(new_mail.set)
+
+    def fetch_new_emails(self) -> List[dict]:
+        with self._lock:
+            new_emails, self._inbox = self._inbox, []
+        return new_emails
+
+    async def wait_for_mail(self, timeout: float):
+        with self._lock:
+            if self._loop is not asyncio.get_running_loop():
+                self._loop = asyncio.get_running_loop()
+                self._new_mail = asyncio.Event()
+            new_mail = self._new_mail
+            if self._inbox:
+                return
+            new_mail.clear()
+
+        try:
+            await asyncio.wait_for(new_mail.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
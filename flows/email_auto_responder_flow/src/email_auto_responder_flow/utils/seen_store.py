@@ -0,0 +1,110 @@
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional, Set
+
+
+class SeenStore:
+    """
+    On-disk record of the email ids already handled and of the sync cursor.
+
+    Ids expire `ttl_seconds` after they were last seen. Adding an id again
+    refreshes it, so ids a backfill search keeps returning never expire while
+    they are still returned. The store stays the size of the recent traffic
+    instead of growing for as long as the flow runs. Both the ids and the cursor survive restarts, so a restarted flow
+    neither redrafts old emails nor resyncs the inbox from scratch.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float, evict_every: float = 3600):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.evict_every = evict_every
+        self._last_evicted_at = 0.0
+        self._lock = threading.Lock()
+        # Sources are called from worker threads, the lock serializes access
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS seen (
+                id TEXT PRIMARY KEY,
+                seen_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS seen_seen_at ON seen (seen_at)"
+        )
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cursor (
+                name TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+            """
+        )
+        self._connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def unseen(self, ids: Iterable[str]) -> Set[str]:
+        """Return the ids that were not seen within the TTL."""
+        ids = set(ids)
+        if not ids:
+            return ids
+
+        expires_before = time.time() - self.ttl_seconds
+        with self._lock:
+            seen = set()
+            batch = list(ids)
+            # Stay below SQLite's limit on the number of query parameters
+            for start in range(0, len(batch), 500):
+                chunk = batch[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    "SELECT id FROM seen "
+                    f"WHERE seen_at >= ? AND id IN ({placeholders})",
+                    [expires_before, *chunk],
+                )
+                seen.update(row[0] for row in rows)
+        return ids - seen
+
+    def add(self, ids: Iterable[str]):
+        """Mark the ids as seen now, refreshing the ones already stored."""
+        now = time.time()
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO seen VALUES (?, ?)",
+                [(message_id, now) for message_id in ids],
+            )
+            if now - self._last_evicted_at >= self.evict_every:
+                self._connection.execute(
+                    "DELETE FROM seen WHERE seen_at < ?", (now - self.ttl_seconds,)
+                )
+                self._last_evicted_at = now
+            self._connection.commit()
+
+    def get_cursor(self, name: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM cursor WHERE name = ?", (name,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def set_cursor(self, name: str, value: str):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cursor VALUES (?, ?)", (name, value)
+            )
+            self._connection.commit()
+
+    def close(self):
+        self._connection.close()
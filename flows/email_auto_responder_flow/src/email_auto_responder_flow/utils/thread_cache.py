@@ -0,0 +1,67 @@
+import copy
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class ThreadCache:
+    """
+    Process-wide cache of Gmail thread contents, keyed by thread id.
+
+    Each entry remembers the history id the thread had when it was fetched.
+    Ingestion reports the history id at which a thread last changed, and an
+    entry older than that is refetched, so agents only ever see a thread as
+    current as the last sync. The least recently used entries are dropped
+    beyond `max_entries`.
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._changed_at: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, thread_id: str) -> Optional[dict]:
+        with self._lock:
+            thread_data = self._entries.get(thread_id)
+            if thread_data is None or int(thread_data["historyId"]) < (
+                self._changed_at.get(thread_id, 0)
+            ):
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(thread_id)
+            # Callers get their own copy so they can't alter the cached thread
+            return copy.deepcopy(thread_data)
+
+    def put(self, thread_id: str, thread_data: dict):
+        with self._lock:
+            self._entries[thread_id] = copy.deepcopy(thread_data)
+            self._entries.move_to_end(thread_id)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._changed_at.pop(evicted, None)
+
+    def invalidate(self, thread_id: str, history_id: str):
+        """Record that the thread changed at `history_id`."""
+        with self._lock:
+            # Also kept for threads not cached yet, a lookup may be in flight
+            changed_at = max(int(history_id), self._changed_at.get(thread_id, 0))
+            self._changed_at[thread_id] = changed_at
+            if len(self._changed_at) > 2 * self.max_entries:
+                self._changed_at = {
+                    thread: changed_at
+                    for thread, changed_at in self._changed_at.items()
+                    if thread in self._entries
+                }
+
+    def summary(self) -> str:
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups if lookups else 0.0
+        return f"hits={self.hits} misses={self.misses} hit_rate={hit_rate:.0%}"
+
+
+thread_cache = ThreadCache()
@@ -0,0 +1,219 @@
+"""
+Compare scoring candidates one per call against batched scoring, offline.
+
+Both crews run on a stub LLM that counts the prompt tokens it is sent and
+answers after a simulated latency, so no API calls are made. Calls go
+through the ScoringEngine with the same concurrency limit as the flow.
+Run from the project root:
+
+    uv run python scripts/bench_batch_scoring.py --leads 200 --batch-size 10
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import re
+import threading
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+import tiktoken  # noqa: E402
+from crewai.llms.base_llm import BaseLLM  # noqa: E402
+
+from lead_score_flow.constants import JOB_DESCRIPTION, LEADS_FILE  # noqa: E402
+from lead_score_flow.crews.lead_batch_score_crew.lead_batch_score_crew import (  # noqa: E402
+    LeadBatchScoreCrew,
+)
+from lead_score_flow.crews.lead_score_crew.lead_score_crew import (  # noqa: E402
+    LeadScoreCrew,
+)
+from lead_score_flow.types import Candidate  # noqa: E402
+from lead_score_flow.utils.candidateUtils import (  # noqa: E402
+    chunked,
+    format_candidates_for_batch,
+    load_candidate_chunks,
+)
+from lead_score_flow.utils.crew_pool import CrewPool  # noqa: E402
+from lead_score_flow.utils.scoring_engine import ScoringEngine  # noqa: E402
+
+REASON = "Solid React experience and a good fit for the team. " * 4
+
+
+class Usage:
+    """Token counts of a StubLLM, shared with the copies each crew makes."""
+
+    def __init__(self):
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.lock = threading.Lock()
+
+
+class StubLLM(BaseLLM):
+    """
+    Answers every scoring prompt with a score for each candidate id in it.
+
+    The reply takes `latency` seconds plus `seconds_per_token` for every
+    token it returns, roughly how a hosted model's response time grows.
+    """
+
+    def __init__(self, latency: float, seconds_per_token: float):
+        super().__init__(model="stub")
+        self.latency = latency
+        self.seconds_per_token = seconds_per_token
+        self.encoding = tiktoken.get_encoding("cl100k_base")
+        # Agent.copy() makes a shallow copy of the LLM, the counts stay shared
+        self.usage = Usage()
+
+    def call(self, messages, *args, **kwargs):
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+        prompt = "\n".join(message["content"] for message in messages)
+        candidate_ids = re.findall(r"Candidate ID: (\S+)", prompt)
+        scores = [
+            {"id": candidate_id, "score": 87, "reason": REASON}
+            for candidate_id in dict.fromkeys(candidate_ids)
+        ]
+        answer = scores[0] if len(scores) == 1 else {"scores": scores}
+        reply = (
+            "Thought: I now can give a great answer\n"
+            f"Final Answer: {json.dumps(answer)}"
+        )
+
+        prompt_tokens = len(self.encoding.encode(prompt))
+        completion_tokens = len(self.encoding.encode(reply))
+        with self.usage.lock:
+            self.usage.calls += 1
+            self.usage.prompt_tokens += prompt_tokens
+            self.usage.completion_tokens += completion_tokens
+        time.sleep(self.latency + completion_tokens * self.seconds_per_token)
+        return reply
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+
+def build_crew(crew_class, llm: StubLLM):
+    crew = crew_class().crew()
+    crew.verbose = False
+    for agent in crew.agents:
+        agent.llm = llm
+        agent.verbose = False
+    return crew
+
+
+def load_leads(count: int):
+    """Repeat the sample leads under new ids until there are `count` of them."""
+    sample = [
+        candidate
+        for chunk in load_candidate_chunks(LEADS_FILE, 100)
+        for candidate in chunk
+    ]
+    return [
+        Candidate(**{**candidate.model_dump(), "id": f"{row}"})
+        for row, candidate in zip(range(count), itertools.cycle(sample))
+    ]
+
+
+async def score_single(leads, llm: StubLLM, concurrency: int) -> int:
+    crews = CrewPool(lambda: build_crew(LeadScoreCrew, llm))
+
+    async def score(candidate: Candidate):
+        result = await crews.get().kickoff_async(
+            inputs={
+                "candidate_id": candidate.id,
+                "name": candidate.name,
+                "bio": candidate.bio,
+                "job_description": JOB_DESCRIPTION,
+                "additional_instructions": "",
+            }
+        )
+        return [result.pydantic]
+
+    return await run(leads, score, concurrency, batch_size=1)
+
+
+async def score_batched(leads, llm: StubLLM, concurrency: int, batch_size: int):
+    crews = CrewPool(lambda: build_crew(LeadBatchScoreCrew, llm))
+
+    async def score(batch):
+        result = await crews.get().kickoff_async(
+            inputs={
+                "candidates": format_candidates_for_batch(batch),
+                "job_description": JOB_DESCRIPTION,
+                "additional_instructions": "",
+            }
+        )
+        return result.pydantic.scores
+
+    return await run(leads, score, concurrency, batch_size)
+
+
+async def run(leads, worker, concurrency: int, batch_size: int) -> int:
+    engine = ScoringEngine(
+        max_concurrency=concurrency,
+        requests_per_minute={},
+        default_requests_per_minute=60_000,
+        report_every=0,
+    )
+    if batch_size == 1:
+        items = leads
+    else:
+        items = chunked(leads, batch_size)
+    results = await engine.map(items, worker, model="stub")
+    return sum(len(scores) for scores in results)
+
+
+def report(label: str, usage: Usage, scored: int, elapsed: float):
+    print(
+        f"{label:<14} calls={usage.calls:<5} scored={scored:<5} "
+        f"prompt_tokens={usage.prompt_tokens:<8} "
+        f"completion_tokens={usage.completion_tokens:<7} wall={elapsed:.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--leads", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument(
+        "--latency", type=float, default=0.5, help="seconds per call before output"
+    )
+    parser.add_argument(
+        "--seconds-per-token",
+        type=float,
+        default=0.005,
+        help="seconds per returned token",
+    )
+    args = parser.parse_args()
+    leads = load_leads(args.leads)
+
+    single_llm = StubLLM(args.latency, args.seconds_per_token)
+    started_at = time.perf_counter()
+    single_scored = asyncio.run(score_single(leads, single_llm, args.concurrency))
+    single_elapsed = time.perf_counter() - started_at
+
+    batch_llm = StubLLM(args.latency, args.seconds_per_token)
+    started_at = time.perf_counter()
+    batch_scored = asyncio.run(
+        score_batched(leads, batch_llm, args.concurrency, args.batch_size)
+    )
+    batch_elapsed = time.perf_counter() - started_at
+
+    print(f"Scoring {args.leads} leads, concurrency {args.concurrency}")
+    report("single", single_llm.usage, single_scored, single_elapsed)
+    report(f"batch of {args.batch_size}", batch_llm.usage, batch_scored, batch_elapsed)
+    saved_tokens = 1 - batch_llm.usage.prompt_tokens / single_llm.usage.prompt_tokens
+    print(
+        f"Prompt tokens saved: {saved_tokens:.0%}, "
+        f"wall-clock saved: {1 - batch_elapsed / single_elapsed:.0%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
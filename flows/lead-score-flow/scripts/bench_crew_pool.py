@@ -0,0 +1,65 @@
+"""
+Time building a scoring crew from scratch against copying it from a CrewPool.
+
+No model is called: the agents get a dummy API key, so only the cost of
+constructing the crew is measured. Run from the project root:
+
+    uv run python scripts/bench_crew_pool.py --runs 200
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+# Building an LLM client only needs a key to be set, it is never used here
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+from lead_score_flow.crews.lead_score_crew.lead_score_crew import (  # noqa: E402
+    LeadScoreCrew,
+)
+from lead_score_flow.utils.crew_pool import CrewPool  # noqa: E402
+
+
+def time_calls(build, runs: int) -> list:
+    timings = []
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        build()
+        timings.append(time.perf_counter() - started_at)
+    return timings
+
+
+def report(label: str, timings: list):
+    print(
+        f"{label:<24} median={statistics.median(timings) * 1000:.2f}ms "
+        f"mean={statistics.mean(timings) * 1000:.2f}ms "
+        f"total={sum(timings):.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=100, help="crews to build")
+    args = parser.parse_args()
+
+    pool = CrewPool(lambda: LeadScoreCrew().crew())
+    # Build the template up front so only the copies are timed
+    template_timings = time_calls(pool.template, 1)
+
+    fresh = time_calls(lambda: LeadScoreCrew().crew(), args.runs)
+    pooled = time_calls(pool.get, args.runs)
+
+    print(f"Building {args.runs} crews")
+    report("LeadScoreCrew().crew()", fresh)
+    report("CrewPool.get()", pooled)
+    report("CrewPool template", template_timings)
+    print(
+        f"Speedup: {statistics.median(fresh) / statistics.median(pooled):.1f}x "
+        "per crew"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Measure the memory and serialization time of the flow state for N leads.
+
+Compares the columnar tables in LeadScoreState against the previous layout,
+which kept one pydantic model per candidate, per score and per scored
+candidate. Run from the project root:
+
+    uv run python scripts/bench_state_size.py --leads 10000 100000
+"""
+
+import argparse
+import copy
+import gc
+import os
+import time
+import tracemalloc
+from typing import List
+
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+from pydantic import BaseModel  # noqa: E402
+
+from lead_score_flow.main import LeadScoreState  # noqa: E402
+from lead_score_flow.types import (  # noqa: E402
+    Candidate,
+    CandidateScore,
+    ScoredCandidate,
+)
+from lead_score_flow.utils.candidate_table import (  # noqa: E402
+    CandidateTable,
+    ScoreTable,
+)
+
+BIO = "Frontend developer with four years of React and TypeScript. " * 5
+REASON = "Strong React background and a good fit for the team. " * 3
+
+
+class ListState(BaseModel):
+    """The state layout before the columnar tables."""
+
+    candidates: List[Candidate] = []
+    candidate_score: List[CandidateScore] = []
+    hydrated_candidates: List[ScoredCandidate] = []
+
+
+def make_leads(count: int):
+    for row in range(count):
+        candidate = Candidate(
+            id=str(row),
+            name=f"Lead {row}",
+            email=f"lead{row}@example.com",
+            bio=BIO,
+            skills="React, TypeScript",
+        )
+        yield candidate, CandidateScore(id=candidate.id, score=row % 100, reason=REASON)
+
+
+def build_list_state(count: int) -> ListState:
+    state = ListState()
+    for candidate, candidate_score in make_leads(count):
+        state.candidates.append(candidate)
+        state.candidate_score.append(candidate_score)
+        state.hydrated_candidates.append(
+            ScoredCandidate(
+                **candidate.model_dump(),
+                score=candidate_score.score,
+                reason=candidate_score.reason,
+            )
+        )
+    return state
+
+
+def build_table_state(count: int) -> LeadScoreState:
+    candidates, scores = CandidateTable(), ScoreTable()
+    for candidate, candidate_score in make_leads(count):
+        candidates.add(candidate)
+        scores.add(candidate_score)
+    return LeadScoreState(candidates=candidates, candidate_score=scores)
+
+
+def measure(build, count: int):
+    gc.collect()
+    tracemalloc.start()
+    state = build(count)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started_at = time.perf_counter()
+    state.model_dump_json()
+    dump_time = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    copy.deepcopy(state)
+    copy_time = time.perf_counter() - started_at
+    return memory, dump_time, copy_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--leads", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    for count in args.leads:
+        print(f"{count} leads")
+        for label, build in [
+            ("pydantic lists", build_list_state),
+            ("columnar tables", build_table_state),
+        ]:
+            memory, dump_time, copy_time = measure(build, count)
+            print(
+                f"  {label:<16} memory={memory / 1e6:7.1f}MB "
+                f"model_dump_json={dump_time * 1000:7.0f}ms "
+                f"deepcopy={copy_time * 1000:7.0f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+import os
+from pathlib import Path
+
 JOB_DESCRIPTION = """
 # Junior React Developer
 
@@ -45,3 +48,47 @@ SKILLS = [
     "REST APIs",
     "CrewAI",
 ]
+
+# Model used by the scoring crew, matching crewAI's default LLM resolution.
+SCORING_MODEL = os.getenv("MODEL", "gpt-4o-mini")
+
+# Scoring engine limits. Size these against your provider quota.
+SCORING_MAX_CONCURRENCY = int(os.getenv("SCORING_MAX_CONCURRENCY", "10"))
+SCORING_MAX_RETRIES = 3
+SCORING_REQUESTS_PER_MINUTE = {
+    "gpt-4o-mini": 500,
+    "gpt-4o": 500,
+}
+SCORING_DEFAULT_REQUESTS_PER_MINUTE = 60
+
+# Number of candidates scored per LLM call. 1 scores every candidate on its own.
+SCORING_BATCH_SIZE = int(os.getenv("SCORING_BATCH_SIZE", "1"))
+
+# Lead ingestion. Leads are read from the CSV in chunks of this size.
+LEADS_FILE = Path(__file__).parent / "leads.csv"
+LEADS_CHUNK_SIZE = 100
+
+# Scores are cached on disk so unchanged candidates are never rescored.
+SCORE_CACHE_FILE = Path(__file__).parent / "score_cache.db"
+
+# Journals of finished work, one per run, used to resume interrupted runs.
+RUNS_DIR = Path(__file__).parent / "runs"
+
+# Where the email written for each candidate is saved.
+EMAIL_RESPONSES_DIR = Path(__file__).parent / "email_responses"
+
+# Candidates outside the top K get this email instead of a full crew run.
+REJECTION_EMAIL_TEMPLATE = """Subject: Your application for the Junior React Developer position
+
+Dear {first_name},
+
+Thank you for applying for the Junior React Developer position at CrewAI and for the time you put into your application. We enjoyed learning about your background{skills_sentence}.
+
+After careful consideration, we have decided to move forward with other candidates whose experience more closely matches the needs of this role. This was not an easy decision, and we truly appreciate your interest in joining our team.
+
+We encourage you to keep an eye on our future openings, and we wish you the very best in your job search.
+
+Best regards,
+Sarah
+HR Coordinator, CrewAI
+"""
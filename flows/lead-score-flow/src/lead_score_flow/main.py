@@ -1,22 +1,83 @@
 #!/usr/bin/env python
+import argparse
 import asyncio
-from typing import List
+import logging
+import os
+import time
+import uuid
+from typing import Iterator, List, Optional
 
 from crewai.flow.flow import Flow, listen, or_, router, start
-from pydantic import BaseModel
-
-from lead_score_flow.constants import JOB_DESCRIPTION
+from pydantic import BaseModel, Field
+
+from lead_score_flow.constants import (
+    EMAIL_RESPONSES_DIR,
+    JOB_DESCRIPTION,
+    LEADS_CHUNK_SIZE,
+    LEADS_FILE,
+    RUNS_DIR,
+    SCORE_CACHE_FILE,
+    SCORING_BATCH_SIZE,
+    SCORING_DEFAULT_REQUESTS_PER_MINUTE,
+    SCORING_MAX_CONCURRENCY,
+    SCORING_MAX_RETRIES,
+    SCORING_MODEL,
+    SCORING_REQUESTS_PER_MINUTE,
+)
+from lead_score_flow.crews.lead_batch_score_crew.lead_batch_score_crew import (
+    LeadBatchScoreCrew,
+)
 from lead_score_flow.crews.lead_response_crew.lead_response_crew import LeadResponseCrew
 from lead_score_flow.crews.lead_score_crew.lead_score_crew import LeadScoreCrew
-from lead_score_flow.types import Candidate, CandidateScore, ScoredCandidate
-from lead_score_flow.utils.candidateUtils import combine_candidates_with_scores
+from lead_score_flow.types import (
+    Candidate,
+    CandidateScore,
+    ReviewPolicy,
+    ScoredCandidate,
+)
+from lead_score_flow.utils.candidateUtils import (
+    chunked,
+    combine_candidates_with_scores,
+    format_candidates_for_batch,
+    load_candidate_chunks,
+)
+from lead_score_flow.utils.candidate_table import CandidateTable, ScoreTable
+from lead_score_flow.utils.crew_pool import CrewPool
+from lead_score_flow.utils.email_writer import EmailWriter, render_rejection_email
+from lead_score_flow.utils.run_journal import RunJournal
+from lead_score_flow.utils.score_cache import ScoreCache
+from lead_score_flow.utils.scoring_engine import ScoringEngine
+from lead_score_flow.utils.top_k import TopKTracker
+
+# Crews are built once per process and copied for every candidate
+lead_score_crews = CrewPool(lambda: LeadScoreCrew().crew())
+lead_batch_score_crews = CrewPool(lambda: LeadBatchScoreCrew().crew())
+lead_response_crews = CrewPool(lambda: LeadResponseCrew().crew())
 
 
 class LeadScoreState(BaseModel):
-    candidates: List[Candidate] = []
-    candidate_score: List[CandidateScore] = []
+    # Flow state id, crewAI fills it in when it is empty
+    id: str = ""
+    candidates: CandidateTable = Field(default_factory=CandidateTable)
+    # Every score, only kept when the leads are loaded up front
+    candidate_score: ScoreTable = Field(default_factory=ScoreTable)
+    scored_leads: int = 0
     hydrated_candidates: List[ScoredCandidate] = []
     scored_leads_feedback: str = ""
+    scoring_max_concurrency: int = SCORING_MAX_CONCURRENCY
+    scoring_batch_size: int = SCORING_BATCH_SIZE
+    leads_file: str = str(LEADS_FILE)
+    leads_chunk_size: int = LEADS_CHUNK_SIZE
+    stream_leads: bool = False
+    score_cache_file: str = str(SCORE_CACHE_FILE)
+    top_k: int = 3
+    top_candidate_scores: List[CandidateScore] = []
+    template_rejections: bool = True
+    run_id: str = ""
+    resumed_decision: str = ""
+    resumed_invited_ids: Optional[List[str]] = None
+    review_policy: ReviewPolicy = Field(default_factory=ReviewPolicy)
+    scoring_round: int = 0
 
 
 class LeadScoreFlow(Flow[LeadScoreState]):
@@ -24,79 +85,224 @@ class LeadScoreFlow(Flow[LeadScoreState]):
 
     @start()
     def load_leads(self):
-        import csv
-        from pathlib import Path
-
-        # Get the path to leads.csv in the same directory
-        current_dir = Path(__file__).parent
-        csv_file = current_dir / "leads.csv"
-
-        candidates = []
-        with open(csv_file, mode="r", newline="", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                # Create a Candidate object for each row
-                print("Row:", row)
-                candidate = Candidate(**row)
-                candidates.append(candidate)
+        if self.state.run_id:
+            # Pick up the reviewer's last feedback and decision from the journal
+            with self.journal() as journal:
+                self.state.scored_leads_feedback = journal.feedback
+                self.state.resumed_decision = journal.decision or ""
+                self.state.resumed_invited_ids = journal.invited_ids
+                # The last journaled round is scored again, so it isn't counted twice
+                self.state.scoring_round = max(journal.scoring_round - 1, 0)
+            print("Resuming run", self.state.run_id)
+        else:
+            self.state.run_id = uuid.uuid4().hex[:12]
+        print(f"Run ID: {self.state.run_id} (resume with: kickoff --resume <run id>)")
+
+        if self.state.stream_leads:
+            # Candidates are read chunk by chunk while they are being scored
+            print("Streaming leads from", self.state.leads_file)
+            return
+
+        candidates = CandidateTable()
+        for chunk in load_candidate_chunks(
+            self.state.leads_file, self.state.leads_chunk_size
+        ):
+            candidates.extend(chunk)
 
         # Update the state with the loaded candidates
         self.state.candidates = candidates
 
+    def journal(self) -> RunJournal:
+        return RunJournal(RUNS_DIR, self.state.run_id)
+
+    def iter_candidates(self) -> Iterator[Candidate]:
+        """
+        Iterate over all candidates, streaming them from the CSV in streaming mode.
+        """
+        if not self.state.stream_leads:
+            yield from self.state.candidates.rows()
+            return
+
+        for chunk in load_candidate_chunks(
+            self.state.leads_file, self.state.leads_chunk_size
+        ):
+            yield from chunk
+
+    def find_candidates(self, candidate_ids: List[str]) -> Iterator[Candidate]:
+        """
+        Look up a few candidates by id, scanning the CSV in streaming mode.
+        """
+        if not self.state.stream_leads:
+            for candidate_id in candidate_ids:
+                candidate = self.state.candidates.get(candidate_id)
+                if candidate is not None:
+                    yield candidate
+            return
+
+        wanted = set(candidate_ids)
+        for candidate in self.iter_candidates():
+            if candidate.id in wanted:
+                yield candidate
+
     @listen(or_(load_leads, "scored_leads_feedback"))
     async def score_leads(self):
-        print("Scoring leads")
-        tasks = []
+        self.state.scoring_round += 1
+        print(f"Scoring leads (round {self.state.scoring_round})")
+        # Every round produces a fresh set of scores for the current feedback
+        self.state.candidate_score = ScoreTable()
+        self.state.scored_leads = 0
+        feedback = self.state.scored_leads_feedback
+        leaderboard = TopKTracker(self.state.top_k)
+        cache = ScoreCache(self.state.score_cache_file)
+        journal = self.journal()
+        journal.record_round(self.state.scoring_round)
+        # Scores already finished in this run for the same feedback are reused
+        resumed_scores = journal.scores(feedback)
+        engine = ScoringEngine(
+            max_concurrency=self.state.scoring_max_concurrency,
+            requests_per_minute=SCORING_REQUESTS_PER_MINUTE,
+            default_requests_per_minute=SCORING_DEFAULT_REQUESTS_PER_MINUTE,
+            max_retries=SCORING_MAX_RETRIES,
+        )
 
-        async def score_single_candidate(candidate: Candidate):
-            result = await (
-                LeadScoreCrew()
-                .crew()
-                .kickoff_async(
-                    inputs={
-                        "candidate_id": candidate.id,
-                        "name": candidate.name,
-                        "bio": candidate.bio,
-                        "job_description": JOB_DESCRIPTION,
-                        "additional_instructions": self.state.scored_leads_feedback,
-                    }
+        def record_score(candidate_score: CandidateScore):
+            self.state.scored_leads += 1
+            if not self.state.stream_leads:
+                self.state.candidate_score.add(candidate_score)
+            if leaderboard.push(candidate_score):
+                print(
+                    "Provisional leaderboard:",
+                    ", ".join(f"{s.id} ({s.score})" for s in leaderboard.top()),
                 )
-            )
 
-            self.state.candidate_score.append(result.pydantic)
+        def uncached_candidates() -> Iterator[Candidate]:
+            for candidate in self.iter_candidates():
+                key = ScoreCache.key_for(candidate, JOB_DESCRIPTION, feedback)
+                resumed_score = resumed_scores.get(candidate.id)
+                if resumed_score is not None:
+                    # The email stage looks every score up in the cache
+                    cache.put(key, resumed_score)
+                    record_score(resumed_score)
+                    continue
+
+                cached_score = cache.get(key)
+                if cached_score is None:
+                    yield candidate
+                else:
+                    journal.record_score(feedback, cached_score)
+                    record_score(cached_score)
+
+        def store_score(candidate: Candidate, candidate_score: CandidateScore):
+            key = ScoreCache.key_for(candidate, JOB_DESCRIPTION, feedback)
+            cache.put(key, candidate_score)
+            journal.record_score(feedback, candidate_score)
+            record_score(candidate_score)
 
-        for candidate in self.state.candidates:
+        async def score_single_candidate(candidate: Candidate):
             print("Scoring candidate:", candidate.name)
-            task = asyncio.create_task(score_single_candidate(candidate))
-            tasks.append(task)
+            result = await lead_score_crews.get().kickoff_async(
+                inputs={
+                    "candidate_id": candidate.id,
+                    "name": candidate.name,
+                    "bio": candidate.bio,
+                    "job_description": JOB_DESCRIPTION,
+                    "additional_instructions": feedback,
+                }
+            )
 
-        candidate_scores = await asyncio.gather(*tasks)
-        print("Finished scoring leads: ", len(candidate_scores))
+            store_score(candidate, result.pydantic)
+            return result.pydantic
 
-    @router(score_leads)
-    def human_in_the_loop(self):
-        print("Finding the top 3 candidates for human to review")
+        async def score_batch(batch: List[Candidate]):
+            if len(batch) == 1:
+                return [await score_single_candidate(batch[0])]
 
-        # Combine candidates with their scores using the helper function
-        self.state.hydrated_candidates = combine_candidates_with_scores(
-            self.state.candidates, self.state.candidate_score
-        )
+            print(f"Scoring batch of {len(batch)} candidates")
+            result = await lead_batch_score_crews.get().kickoff_async(
+                inputs={
+                    "candidates": format_candidates_for_batch(batch),
+                    "job_description": JOB_DESCRIPTION,
+                    "additional_instructions": feedback,
+                }
+            )
 
-        # Sort the scored candidates by their score in descending order
-        sorted_candidates = sorted(
-            self.state.hydrated_candidates, key=lambda c: c.score, reverse=True
-        )
-        self.state.hydrated_candidates = sorted_candidates
+            # Map the scores back by candidate id, ignoring any unknown ids
+            batch_scores = result.pydantic.scores if result.pydantic else []
+            returned = {score.id: score for score in batch_scores}
+            scores, missing = [], []
+            for candidate in batch:
+                candidate_score = returned.get(candidate.id)
+                if candidate_score is None:
+                    missing.append(candidate)
+                else:
+                    store_score(candidate, candidate_score)
+                    scores.append(candidate_score)
+
+            if missing:
+                print(f"{len(missing)} candidates missing from batch response")
+                # Each one is scored on its own once a concurrency slot frees up
+                for candidate in missing:
+                    engine.requeue([candidate])
+            return scores
+
+        with cache, journal:
+            print("Resumed scores:", len(resumed_scores))
+            await engine.map(
+                chunked(uncached_candidates(), self.state.scoring_batch_size),
+                score_batch,
+                model=SCORING_MODEL,
+                # Every score is stored in the cache and the journal as it arrives
+                collect_results=False,
+            )
+            print("Finished scoring leads: ", self.state.scored_leads)
+            print("Scoring stats:", engine.stats.summary())
+            print("Score cache:", cache.summary())
 
-        # Select the top 3 candidates
-        top_candidates = sorted_candidates[:3]
+        self.state.top_candidate_scores = leaderboard.top()
 
-        print("Here are the top 3 candidates:")
-        for candidate in top_candidates:
+    @router(score_leads)
+    def human_in_the_loop(self):
+        top_k = self.state.top_k
+        print(f"Finding the top {top_k} candidates for human to review")
+
+        # Only the leaderboard is hydrated, the ranking was kept while scoring
+        top_ids = [score.id for score in self.state.top_candidate_scores]
+        hydrated = {
+            candidate.id: candidate
+            for candidate in combine_candidates_with_scores(
+                self.find_candidates(top_ids), self.state.top_candidate_scores
+            )
+        }
+        self.state.hydrated_candidates = [
+            hydrated[candidate_id]
+            for candidate_id in top_ids
+            if candidate_id in hydrated
+        ]
+
+        print(f"Here are the top {top_k} candidates:")
+        for candidate in self.state.hydrated_candidates:
             print(
                 f"ID: {candidate.id}, Name: {candidate.name}, Score: {candidate.score}, Reason: {candidate.reason}"
             )
 
+        if self.state.resumed_decision:
+            decision = self.state.resumed_decision
+            self.state.resumed_decision = ""
+            invited_ids = self.state.resumed_invited_ids
+            if invited_ids is not None:
+                # Only the candidates the decision invited, e.g. after the policy
+                # filtered out leaders below its minimum score
+                self.state.hydrated_candidates = [
+                    candidate
+                    for candidate in self.state.hydrated_candidates
+                    if candidate.id in invited_ids
+                ]
+            print("\nResuming with the decision made before the interruption.")
+            return decision
+
+        if not self.state.review_policy.interactive:
+            return self.apply_review_policy()
+
         # Present options to the user
         print("\nPlease choose an option:")
         print("1. Quit")
@@ -107,91 +313,261 @@ class LeadScoreFlow(Flow[LeadScoreState]):
 
         if choice == "1":
             print("Exiting the program.")
-            exit()
+            return "quit"
         elif choice == "2":
             feedback = input(
                 "\nPlease provide additional feedback on what you're looking for in candidates:\n"
             )
-            self.state.scored_leads_feedback = feedback
-            print("\nRe-running lead scoring with your feedback...")
-            return "scored_leads_feedback"
+            return self.rescore_with_feedback(feedback)
         elif choice == "3":
-            print("\nProceeding to write emails to all leads.")
-            return "generate_emails"
+            return self.proceed_to_emails()
         else:
             print("\nInvalid choice. Please try again.")
             return "human_in_the_loop"
 
+    def apply_review_policy(self) -> str:
+        """
+        Decide the next step from the review policy instead of asking a human.
+        """
+        policy = self.state.review_policy
+        qualified = [
+            candidate
+            for candidate in self.state.hydrated_candidates
+            if candidate.score >= policy.min_score
+        ]
+        if (
+            not qualified
+            and policy.feedback
+            and self.state.scoring_round < policy.max_rounds
+        ):
+            print(f"\nNo top candidate scored {policy.min_score} or more.")
+            return self.rescore_with_feedback(policy.feedback)
+
+        # Only leaders that meet the threshold get an email to proceed
+        self.state.hydrated_candidates = qualified
+        return self.proceed_to_emails()
+
+    def rescore_with_feedback(self, feedback: str) -> str:
+        self.state.scored_leads_feedback = feedback
+        with self.journal() as journal:
+            journal.record_feedback(feedback)
+        print("\nRe-running lead scoring with your feedback...")
+        return "scored_leads_feedback"
+
+    def proceed_to_emails(self) -> str:
+        print("\nProceeding to write emails to all leads.")
+        invited_ids = [candidate.id for candidate in self.state.hydrated_candidates]
+        with self.journal() as journal:
+            journal.record_decision("generate_emails", invited_ids)
+        return "generate_emails"
+
     @listen("generate_emails")
     async def write_and_save_emails(self):
-        import re
-        from pathlib import Path
-
         print("Writing and saving emails for all leads.")
 
-        # Determine the top 3 candidates to proceed with
+        # Determine the top candidates to proceed with
         top_candidate_ids = {
-            candidate.id for candidate in self.state.hydrated_candidates[:3]
+            candidate.id for candidate in self.state.hydrated_candidates
         }
 
-        tasks = []
-
         # Create the directory 'email_responses' if it doesn't exist
-        output_dir = Path(__file__).parent / "email_responses"
-        print("output_dir:", output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        async def write_email(candidate):
-            # Check if the candidate is among the top 3
-            proceed_with_candidate = candidate.id in top_candidate_ids
-
-            # Kick off the LeadResponseCrew for each candidate
-            result = await (
-                LeadResponseCrew()
-                .crew()
-                .kickoff_async(
-                    inputs={
-                        "candidate_id": candidate.id,
-                        "name": candidate.name,
-                        "bio": candidate.bio,
-                        "proceed_with_candidate": proceed_with_candidate,
-                    }
-                )
+        writer = EmailWriter(EMAIL_RESPONSES_DIR)
+        print("output_dir:", writer.output_dir)
+        journal = self.journal()
+        cache = ScoreCache(self.state.score_cache_file)
+        feedback = self.state.scored_leads_feedback
+        # Streamed runs print a count instead of holding a message per lead
+        collect_results = not self.state.stream_leads
+
+        # Emails saved before an interruption keep their files and filenames
+        saved_emails = {
+            candidate_id: filename
+            for candidate_id, filename in journal.emails().items()
+            if (writer.output_dir / filename).exists()
+        }
+        for filename in saved_emails.values():
+            writer.claim(filename)
+        engine = ScoringEngine(
+            max_concurrency=self.state.scoring_max_concurrency,
+            requests_per_minute=SCORING_REQUESTS_PER_MINUTE,
+            default_requests_per_minute=SCORING_DEFAULT_REQUESTS_PER_MINUTE,
+            max_retries=SCORING_MAX_RETRIES,
+        )
+
+        async def write_email(job):
+            candidate, proceed_with_candidate = job
+
+            # Kick off the LeadResponseCrew for the candidate
+            result = await lead_response_crews.get().kickoff_async(
+                inputs={
+                    "candidate_id": candidate.id,
+                    "name": candidate.name,
+                    "bio": candidate.bio,
+                    "proceed_with_candidate": proceed_with_candidate,
+                }
             )
+            return await save_email(candidate, result.raw)
 
-            # Sanitize the candidate's name to create a valid filename
-            safe_name = re.sub(r"[^a-zA-Z0-9_\- ]", "", candidate.name)
-            filename = f"{safe_name}.txt"
-            print("Filename:", filename)
+        unsaved_emails = 0
 
-            # Write the email content to a text file
-            file_path = output_dir / filename
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(result.raw)
+        async def save_email(candidate: Candidate, content: str):
+            nonlocal unsaved_emails
+            filename = writer.filename_for(candidate)
+            print("Filename:", filename)
+            try:
+                await writer.write(filename, content)
+            except OSError as e:
+                # Not raised into the engine's retries, writing again would fail
+                # the same way and a crew email would be paid for again
+                unsaved_emails += 1
+                print(f"Could not save the email for {candidate.name}: {e}")
+                return f"Email not saved for {candidate.name}: {e}"
+            journal.record_email(candidate.id, filename)
 
             # Return a message indicating the email was saved
             return f"Email saved for {candidate.name} as {filename}"
 
-        # Create tasks for all candidates
-        for candidate in self.state.hydrated_candidates:
-            task = asyncio.create_task(write_email(candidate))
-            tasks.append(task)
-
-        # Run all email-writing tasks concurrently and collect results
-        email_results = await asyncio.gather(*tasks)
+        async def save_rejections(jobs: Iterator[tuple]) -> List[str]:
+            # Template emails only wait on the disk, so they skip the model's
+            # rate limit but keep the same bound on writes in flight
+            results = []
+
+            async def consume():
+                for candidate, _ in jobs:
+                    result = await save_email(
+                        candidate, render_rejection_email(candidate)
+                    )
+                    if collect_results:
+                        results.append(result)
+
+            await asyncio.gather(*(consume() for _ in range(engine.max_concurrency)))
+            return results
+
+        def pending_emails(templated: bool) -> Iterator[tuple]:
+            """
+            Scored candidates still waiting for an email, either the ones that
+            get the rejection template or the ones the crew writes to.
+            """
+            for candidate in self.iter_candidates():
+                if candidate.id in saved_emails:
+                    continue
+                key = ScoreCache.key_for(candidate, JOB_DESCRIPTION, feedback)
+                if cache.get(key) is None:
+                    # Scoring gave up on this candidate
+                    continue
+                proceed_with_candidate = candidate.id in top_candidate_ids
+                # Rejections use the template unless disabled in the state
+                uses_template = (
+                    not proceed_with_candidate and self.state.template_rejections
+                )
+                if uses_template == templated:
+                    yield candidate, proceed_with_candidate
+
+        with cache, journal:
+            rejection_results, crew_results = await asyncio.gather(
+                save_rejections(pending_emails(templated=True)),
+                engine.map(
+                    pending_emails(templated=False),
+                    write_email,
+                    model=SCORING_MODEL,
+                    collect_results=collect_results,
+                ),
+            )
 
         # After all emails have been generated and saved
         print("\nAll emails have been written and saved to 'email_responses' folder.")
-        for message in email_results:
+        if saved_emails:
+            print(f"{len(saved_emails)} emails were already saved before resuming")
+        if unsaved_emails:
+            print(f"{unsaved_emails} emails could not be saved")
+        for message in rejection_results + crew_results:
             print(message)
 
 
-def kickoff():
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the lead score flow.")
+    parser.add_argument("--resume", metavar="RUN_ID", help="resume an interrupted run")
+    parser.add_argument(
+        "--leads",
+        metavar="CSV",
+        action="append",
+        help="leads file to score, repeat to run several files back to back",
+    )
+    parser.add_argument(
+        "--auto",
+        action="store_true",
+        help="decide after scoring with the review policy instead of prompting",
+    )
+    parser.add_argument("--top-k", type=int, help="number of candidates to invite")
+    parser.add_argument(
+        "--min-score", type=int, help="lowest score a top candidate is invited with"
+    )
+    parser.add_argument(
+        "--feedback", help="feedback to rescore with when no top candidate qualifies"
+    )
+    parser.add_argument("--max-rounds", type=int, help="maximum scoring rounds")
+    parser.add_argument("--concurrency", type=int, help="maximum calls in flight")
+    parser.add_argument("--batch-size", type=int, help="candidates per scoring call")
+    parser.add_argument(
+        "--stream", action="store_true", help="stream leads from the file in chunks"
+    )
+    return parser.parse_known_args()[0]
+
+
+def kickoff(resume: Optional[str] = None):
     """
-    Run the flow.
+    Run the flow once per leads file, or resume an interrupted run.
     """
-    lead_score_flow = LeadScoreFlow()
-    lead_score_flow.kickoff()
+    args = parse_args()
+    resume = resume or args.resume
+    leads_files = args.leads or [None]
+    if resume and len(leads_files) > 1:
+        raise SystemExit("--resume can only be used with a single leads file")
+
+    # Set LOG_LEVEL=DEBUG to log every row read from the leads file
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper())
+
+    inputs = {
+        "top_k": args.top_k,
+        "scoring_max_concurrency": args.concurrency,
+        "scoring_batch_size": args.batch_size,
+        "stream_leads": args.stream or None,
+        "run_id": resume,
+    }
+    policy = {
+        "interactive": not args.auto,
+        "min_score": args.min_score,
+        "feedback": args.feedback,
+        "max_rounds": args.max_rounds,
+    }
+    inputs["review_policy"] = {k: v for k, v in policy.items() if v is not None}
+
+    # Runs share the process, so crews built by the first run are reused
+    started_at = time.monotonic()
+    total_scored = 0
+    for leads_file in leads_files:
+        run_inputs = {k: v for k, v in inputs.items() if v is not None}
+        if leads_file:
+            run_inputs["leads_file"] = leads_file
+
+        run_started_at = time.monotonic()
+        lead_score_flow = LeadScoreFlow()
+        lead_score_flow.kickoff(inputs=run_inputs)
+
+        scored = lead_score_flow.state.scored_leads
+        total_scored += scored
+        print_throughput("Run", scored, time.monotonic() - run_started_at)
+
+    if len(leads_files) > 1:
+        print_throughput("All runs", total_scored, time.monotonic() - started_at)
+
+
+def print_throughput(label: str, scored: int, elapsed: float):
+    leads_per_hour = scored / elapsed * 3600 if elapsed > 0 else 0.0
+    print(
+        f"{label}: scored {scored} leads in {elapsed:.1f}s "
+        f"({leads_per_hour:.0f} leads/hour)"
+    )
 
 
 def plot():
@@ -1,3 +1,5 @@
+from typing import List
+
 from pydantic import BaseModel
 
 
@@ -21,6 +23,10 @@ class CandidateScore(BaseModel):
     reason: str
 
 
+class CandidateScoreBatch(BaseModel):
+    scores: List[CandidateScore]
+
+
 class ScoredCandidate(BaseModel):
     id: str
     name: str
@@ -29,3 +35,19 @@ class ScoredCandidate(BaseModel):
     skills: str
     score: int
     reason: str
+
+
+class ReviewPolicy(BaseModel):
+    """
+    Replaces the human review step when the flow runs unattended.
+
+    If no top candidate reaches `min_score`, the leads are rescored with
+    `feedback` until `max_rounds` scoring rounds have run. Otherwise, or once
+    the rounds are used up, emails are written and only top candidates that
+    reach `min_score` are invited.
+    """
+
+    interactive: bool = True
+    min_score: int = 0
+    feedback: str = ""
+    max_rounds: int = 2
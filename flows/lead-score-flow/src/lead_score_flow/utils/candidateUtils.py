@@ -1,20 +1,64 @@
-from typing import List
+import csv
+import logging
+from typing import Iterable, Iterator, List
 
 from lead_score_flow.types import Candidate, CandidateScore, ScoredCandidate
 
+logger = logging.getLogger(__name__)
+
+
+def load_candidate_chunks(csv_file, chunk_size: int) -> Iterator[List[Candidate]]:
+    """
+    Stream candidates from a CSV file in chunks of at most `chunk_size`.
+
+    Only one chunk is held in memory at a time, so the file size does not
+    affect peak memory.
+    """
+    with open(csv_file, mode="r", newline="", encoding="utf-8") as file:
+        yield from chunked(_read_candidates(csv.DictReader(file)), chunk_size)
+
+
+def _read_candidates(reader: csv.DictReader) -> Iterator[Candidate]:
+    for row in reader:
+        logger.debug("Row: %s", row)
+        yield Candidate(**row)
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    """
+    Group any iterable into lists of at most `size` items, lazily.
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def format_candidates_for_batch(candidates: List[Candidate]) -> str:
+    """
+    Render a batch of candidates for the batch scoring prompt.
+    """
+    return "\n\n".join(
+        f"Candidate ID: {candidate.id}\nName: {candidate.name}\nBio:\n{candidate.bio}"
+        for candidate in candidates
+    )
+
 
 def combine_candidates_with_scores(
-    candidates: List[Candidate], candidate_scores: List[CandidateScore]
+    candidates: Iterable[Candidate], candidate_scores: List[CandidateScore]
 ) -> List[ScoredCandidate]:
     """
     Combine the candidates with their scores using a dictionary for efficient lookups.
     """
     print("COMBINING CANDIDATES WITH SCORES")
-    print("SCORES:", candidate_scores)
-    print("CANDIDATES:", candidates)
+    logger.debug("SCORES: %s", candidate_scores)
     # Create a dictionary to map score IDs to their corresponding CandidateScore objects
     score_dict = {score.id: score for score in candidate_scores}
-    print("SCORE DICT:", score_dict)
+    logger.debug("SCORE DICT: %s", score_dict)
 
     scored_candidates = []
     for candidate in candidates:
@@ -32,5 +76,5 @@ def combine_candidates_with_scores(
                 )
             )
 
-    print("SCORED CANDIDATES:", scored_candidates)
+    logger.debug("SCORED CANDIDATES: %s", scored_candidates)
     return scored_candidates
@@ -0,0 +1,114 @@
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from pydantic import BaseModel, PrivateAttr
+
+from lead_score_flow.types import Candidate, CandidateScore
+
+
+class CandidateTable(BaseModel):
+    """
+    Column-oriented store of candidates indexed by id.
+
+    Keeping one list per field instead of one pydantic model per row avoids the
+    per-object overhead and keeps flow state serialization to a handful of
+    flat string lists. Rows are materialized as `Candidate` only when read.
+    """
+
+    id: List[str] = []
+    name: List[str] = []
+    email: List[str] = []
+    bio: List[str] = []
+    skills: List[str] = []
+    _index: Dict[str, int] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context):
+        self._index = {candidate_id: row for row, candidate_id in enumerate(self.id)}
+
+    def __len__(self):
+        return len(self.id)
+
+    def __contains__(self, candidate_id: str):
+        return candidate_id in self._index
+
+    def add(self, candidate: Candidate):
+        row = self._index.get(candidate.id)
+        if row is None:
+            self._index[candidate.id] = len(self.id)
+            self.id.append(candidate.id)
+            self.name.append(candidate.name)
+            self.email.append(candidate.email)
+            self.bio.append(candidate.bio)
+            self.skills.append(candidate.skills)
+        else:
+            self.name[row] = candidate.name
+            self.email[row] = candidate.email
+            self.bio[row] = candidate.bio
+            self.skills[row] = candidate.skills
+
+    def extend(self, candidates: Iterable[Candidate]):
+        for candidate in candidates:
+            self.add(candidate)
+
+    def row(self, row: int) -> Candidate:
+        return Candidate(
+            id=self.id[row],
+            name=self.name[row],
+            email=self.email[row],
+            bio=self.bio[row],
+            skills=self.skills[row],
+        )
+
+    def get(self, candidate_id: str) -> Optional[Candidate]:
+        row = self._index.get(candidate_id)
+        return None if row is None else self.row(row)
+
+    def rows(self) -> Iterator[Candidate]:
+        for row in range(len(self.id)):
+            yield self.row(row)
+
+
+class ScoreTable(BaseModel):
+    """
+    Column-oriented store of candidate scores indexed by candidate id.
+
+    Adding a score for a candidate that was already scored replaces it, so a
+    table never holds duplicate scores.
+    """
+
+    id: List[str] = []
+    score: List[int] = []
+    reason: List[str] = []
+    _index: Dict[str, int] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context):
+        self._index = {candidate_id: row for row, candidate_id in enumerate(self.id)}
+
+    def __len__(self):
+        return len(self.id)
+
+    def __contains__(self, candidate_id: str):
+        return candidate_id in self._index
+
+    def add(self, candidate_score: CandidateScore):
+        row = self._index.get(candidate_score.id)
+        if row is None:
+            self._index[candidate_score.id] = len(self.id)
+            self.id.append(candidate_score.id)
+            self.score.append(candidate_score.score)
+            self.reason.append(candidate_score.reason)
+        else:
+            self.score[row] = candidate_score.score
+            self.reason[row] = candidate_score.reason
+
+    def row(self, row: int) -> CandidateScore:
+        return CandidateScore(
+            id=self.id[row], score=self.score[row], reason=self.reason[row]
+        )
+
+    def get(self, candidate_id: str) -> Optional[CandidateScore]:
+        row = self._index.get(candidate_id)
+        return None if row is None else self.row(row)
+
+    def rows(self) -> Iterator[CandidateScore]:
+        for row in range(len(self.id)):
+            yield self.row(row)
@@ -0,0 +1,30 @@
+import threading
+from typing import Callable, Optional
+
+from crewai import Crew
+
+
+class CrewPool:
+    """
+    Builds a crew once and hands out a fresh copy for every run.
+
+    Building a crew from its `CrewBase` class re-reads the YAML config and
+    constructs every agent, task and LLM client. `Crew.copy()` reuses the
+    agents' LLM clients and tools and only clones the agent and task objects,
+    so each run still gets its own instance to interpolate inputs into.
+    """
+
+    def __init__(self, build_crew: Callable[[], Crew]):
+        self._build_crew = build_crew
+        self._template: Optional[Crew] = None
+        self._lock = threading.Lock()
+
+    def template(self) -> Crew:
+        if self._template is None:
+            with self._lock:
+                if self._template is None:
+                    self._template = self._build_crew()
+        return self._template
+
+    def get(self) -> Crew:
+        return self.template().copy()
@@ -0,0 +1,95 @@
+import asyncio
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Set
+
+from lead_score_flow.constants import REJECTION_EMAIL_TEMPLATE
+from lead_score_flow.types import Candidate
+
+
+class EmailWriter:
+    """
+    Output stage that saves one email per candidate.
+
+    Files are written on a worker thread so disk I/O never blocks the event
+    loop, and each file is written to a temporary file first and renamed into
+    place, so a crash never leaves a half-written email behind.
+    """
+
+    def __init__(self, output_dir: Path):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._reserved: Set[str] = set()
+
+    def filename_for(self, candidate: Candidate) -> str:
+        """
+        Build a filename from the candidate's name, adding the candidate id
+        when another candidate in this run already uses that name.
+        """
+        # Sanitize the candidate's name to create a valid filename
+        safe_name = re.sub(r"[^a-zA-Z0-9_\- ]", "", candidate.name)
+        filename = f"{safe_name}.txt"
+        if filename in self._reserved:
+            safe_id = re.sub(r"[^a-zA-Z0-9_\-]", "", candidate.id)
+            filename = f"{safe_name}_{safe_id}.txt"
+        return filename
+
+    def claim(self, filename: str):
+        """
+        Reserve a filename for this run, e.g. for an email saved before a resume.
+
+        Raises FileExistsError if the filename was already claimed.
+        """
+        if filename in self._reserved:
+            raise FileExistsError(f"Email file {filename} was already written")
+        self._reserved.add(filename)
+
+    async def write(self, filename: str, content: str) -> Path:
+        """
+        Atomically write `content` to `filename` in the output directory.
+
+        Raises FileExistsError if another email in this run already claimed
+        the same filename.
+        """
+        self.claim(filename)
+        file_path = self.output_dir / filename
+        await asyncio.to_thread(self._write_atomic, file_path, content)
+        return file_path
+
+    @staticmethod
+    def _write_atomic(file_path: Path, content: str):
+        fd, tmp_path = tempfile.mkstemp(
+            dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def render_rejection_email(candidate: Candidate) -> str:
+    """
+    Fill the rejection template with the candidate's name and listed skills.
+    """
+    first_name = candidate.name.split()[0] if candidate.name.strip() else "there"
+    skills = [skill.strip() for skill in candidate.skills.split(",") if skill.strip()]
+    if len(skills) > 1:
+        skills_sentence = (
+            f", especially your experience with {', '.join(skills[:-1])}"
+            f" and {skills[-1]}"
+        )
+    elif skills:
+        skills_sentence = f", especially your experience with {skills[0]}"
+    else:
+        skills_sentence = ""
+
+    return REJECTION_EMAIL_TEMPLATE.format(
+        first_name=first_name, skills_sentence=skills_sentence
+    )
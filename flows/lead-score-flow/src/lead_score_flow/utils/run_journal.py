@@ -0,0 +1,121 @@
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from lead_score_flow.types import CandidateScore
+
+
+class RunJournal:
+    """
+    Append-only JSON lines journal of the work finished in one flow run.
+
+    Every score, scoring round, reviewer decision and saved email is appended
+    and flushed as soon as it happens, so a run that dies halfway can be resumed with only
+    the pending candidates. A line torn by a crash is ignored on load.
+
+    Only what a resume needs is indexed: the scores read back from disk for
+    the latest feedback. Scores recorded during this run are written but not
+    kept, the flow looks them up in the score cache.
+    """
+
+    def __init__(self, directory: Path, run_id: str):
+        self.path = Path(directory) / f"{run_id}.jsonl"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.feedback = ""
+        self.decision: Optional[str] = None
+        # Candidates the decision invites, None if it was journaled without them
+        self.invited_ids: Optional[List[str]] = None
+        self.scoring_round = 0
+        self._scores: Dict[str, CandidateScore] = {}
+        self._emails: Dict[str, str] = {}
+        self._torn = False
+        self._load()
+        self._file = open(self.path, "a", encoding="utf-8")
+        if self._torn:
+            # Terminate a line torn by a crash so the next record starts cleanly
+            self._file.write("\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                self._torn = not line.endswith("\n")
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._apply(record)
+
+    def _apply(self, record: dict):
+        kind = record["type"]
+        if kind == "score":
+            if record["feedback"] == self.feedback:
+                score = CandidateScore(**record["score"])
+                self._scores[score.id] = score
+        elif kind == "round":
+            self.scoring_round = record["round"]
+        elif kind == "feedback":
+            self.feedback = record["feedback"]
+            self.decision = None
+            self.invited_ids = None
+            # Scores for earlier feedback are never resumed
+            self._scores = {}
+        elif kind == "decision":
+            self.decision = record["decision"]
+            self.invited_ids = record.get("invited_ids")
+        elif kind == "email":
+            self._emails[record["candidate_id"]] = record["filename"]
+
+    def _append(self, record: dict):
+        if record["type"] != "score":
+            self._apply(record)
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def scores(self, feedback: str) -> Dict[str, CandidateScore]:
+        """
+        Scores finished before this journal was opened for the given feedback.
+        """
+        if feedback != self.feedback:
+            return {}
+        return dict(self._scores)
+
+    def emails(self) -> Dict[str, str]:
+        """Filenames of the emails already saved, by candidate id."""
+        return self._emails
+
+    def record_score(self, feedback: str, candidate_score: CandidateScore):
+        self._append(
+            {
+                "type": "score",
+                "feedback": feedback,
+                "score": candidate_score.model_dump(),
+            }
+        )
+
+    def record_feedback(self, feedback: str):
+        self._append({"type": "feedback", "feedback": feedback})
+
+    def record_round(self, scoring_round: int):
+        self._append({"type": "round", "round": scoring_round})
+
+    def record_decision(self, decision: str, invited_ids: List[str]):
+        self._append(
+            {"type": "decision", "decision": decision, "invited_ids": invited_ids}
+        )
+
+    def record_email(self, candidate_id: str, filename: str):
+        self._append(
+            {"type": "email", "candidate_id": candidate_id, "filename": filename}
+        )
+
+    def close(self):
+        self._file.close()
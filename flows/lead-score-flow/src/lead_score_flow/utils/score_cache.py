@@ -0,0 +1,78 @@
+import hashlib
+import json
+import sqlite3
+import time
+from typing import Optional
+
+from lead_score_flow.types import Candidate, CandidateScore
+
+
+class ScoreCache:
+    """
+    On-disk cache of candidate scores backed by SQLite.
+
+    Entries are keyed by a hash of everything that influences a score, so a
+    candidate is only rescored when its bio, the job description or the
+    reviewer feedback changes. Every score is committed as soon as it is
+    stored, which lets a crashed run pick up where it left off.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scores (
+                key TEXT PRIMARY KEY,
+                candidate_id TEXT NOT NULL,
+                score INTEGER NOT NULL,
+                reason TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def key_for(candidate: Candidate, job_description: str, feedback: str) -> str:
+        payload = json.dumps(
+            [candidate.id, candidate.bio, job_description, feedback],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CandidateScore]:
+        row = self._connection.execute(
+            "SELECT candidate_id, score, reason FROM scores WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        candidate_id, score, reason = row
+        return CandidateScore(id=candidate_id, score=score, reason=reason)
+
+    def put(self, key: str, score: CandidateScore):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?)",
+            (key, score.id, score.score, score.reason, time.time()),
+        )
+        self._connection.commit()
+
+    def summary(self) -> str:
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups if lookups else 0.0
+        return f"hits={self.hits} misses={self.misses} hit_rate={hit_rate:.0%}"
+
+    def close(self):
+        self._connection.close()
@@ -0,0 +1,201 @@
+import asyncio
+import random
+import time
+from collections import deque
+from typing import (
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Marks the end of the items in `ScoringEngine.map`
+_DONE = object()
+
+
+class TokenBucket:
+    """
+    Async token bucket used to keep the request rate to a model under its quota.
+    """
+
+    def __init__(self, requests_per_minute: float, burst: Optional[float] = None):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = burst if burst is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class ScoringStats:
+    """
+    Live counters for a scoring round, used to size the concurrency limit.
+    """
+
+    def __init__(self, latency_window: int = 1000):
+        self.started_at = time.monotonic()
+        self.completed = 0
+        self.failed = 0
+        self.retries = 0
+        self.in_flight = 0
+        self.latencies = deque(maxlen=latency_window)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Completed calls per second since the round started."""
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile))
+        return ordered[index]
+
+    def summary(self) -> str:
+        return (
+            f"completed={self.completed} failed={self.failed} "
+            f"in_flight={self.in_flight} retries={self.retries} "
+            f"throughput={self.throughput:.2f}/s "
+            f"p50={self.latency_percentile(0.5):.2f}s "
+            f"p95={self.latency_percentile(0.95):.2f}s"
+        )
+
+
+class ScoringEngine:
+    """
+    Runs scoring calls with a bounded number of in-flight requests, a token bucket
+    per model and retries with exponential backoff and full jitter.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        requests_per_minute: Dict[str, float],
+        default_requests_per_minute: float,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
+        report_every: int = 25,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.requests_per_minute = requests_per_minute
+        self.default_requests_per_minute = default_requests_per_minute
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.report_every = report_every
+        self.stats = ScoringStats()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._requeued: Deque = deque()
+
+    def bucket_for(self, model: str) -> TokenBucket:
+        if model not in self._buckets:
+            rate = self.requests_per_minute.get(model, self.default_requests_per_minute)
+            self._buckets[model] = TokenBucket(rate)
+        return self._buckets[model]
+
+    def backoff_delay(self, attempt: int) -> float:
+        return random.uniform(
+            0, min(self.retry_max_delay, self.retry_base_delay * 2**attempt)
+        )
+
+    async def call(self, worker: Callable[[T], Awaitable[R]], item: T, model: str) -> R:
+        """
+        Run a single call with rate limiting and retries, recording its latency.
+        """
+        bucket = self.bucket_for(model)
+        attempt = 0
+        while True:
+            await bucket.acquire()
+            self.stats.in_flight += 1
+            started_at = time.monotonic()
+            try:
+                result = await worker(item)
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff_delay(attempt)
+                attempt += 1
+                self.stats.retries += 1
+                print(f"Scoring call failed ({e}), retry {attempt} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            finally:
+                self.stats.in_flight -= 1
+
+            self.stats.latencies.append(time.monotonic() - started_at)
+            self.stats.completed += 1
+            if self.report_every and self.stats.completed % self.report_every == 0:
+                print("Scoring progress:", self.stats.summary())
+            return result
+
+    def requeue(self, item: T):
+        """
+        Queue `item` to run again in the current `map`, e.g. the part of a
+        batch that needs its own call, so it waits for a free slot like any
+        other item instead of running on top of the concurrency limit.
+        """
+        self._requeued.append(item)
+
+    async def map(
+        self,
+        items: Iterable[T],
+        worker: Callable[[T], Awaitable[R]],
+        model: str,
+        collect_results: bool = True,
+    ) -> List[R]:
+        """
+        Apply `worker` to every item with at most `max_concurrency` calls in flight.
+
+        Items are pulled lazily, so only `max_concurrency` tasks exist at any time.
+        Items that still fail after all retries are counted and skipped. Pass
+        `collect_results=False` when the worker stores its own results, so
+        they aren't also held in a list for the whole run.
+        """
+        iterator = iter(items)
+        results: List[R] = []
+        self._requeued = deque()
+
+        def next_item():
+            if self._requeued:
+                return self._requeued.popleft()
+            return next(iterator, _DONE)
+
+        async def consume():
+            # A worker that requeues items runs them itself before stopping
+            while (item := next_item()) is not _DONE:
+                try:
+                    result = await self.call(worker, item, model)
+                    if collect_results:
+                        results.append(result)
+                except Exception as e:
+                    self.stats.failed += 1
+                    print(f"Giving up after {self.max_retries} retries: {e}")
+
+        await asyncio.gather(*(consume() for _ in range(self.max_concurrency)))
+        return results
@@ -0,0 +1,47 @@
+import heapq
+from itertools import count
+from typing import List, Tuple
+
+from lead_score_flow.types import CandidateScore
+
+
+class TopKTracker:
+    """
+    Keeps the K highest scores seen so far in a min-heap.
+
+    Each push is O(log K), so the leaderboard can be updated as every score
+    arrives instead of sorting the whole list at the end. Ties keep the
+    candidate that was scored first, like a stable sort would.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[Tuple[int, int, CandidateScore]] = []
+        self._order = count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, candidate_score: CandidateScore) -> bool:
+        """
+        Offer a score to the leaderboard. Returns True if it made the top K.
+        """
+        if self.k <= 0:
+            return False
+
+        # Later arrivals get a lower tie-breaker so they are evicted first
+        entry = (candidate_score.score, -next(self._order), candidate_score)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return True
+        if entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def top(self) -> List[CandidateScore]:
+        """
+        Return the current leaderboard, highest score first.
+        """
+        ranked = sorted(self._heap, key=lambda entry: entry[:2], reverse=True)
+        return [entry[2] for entry in ranked]
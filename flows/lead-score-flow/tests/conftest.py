@@ -0,0 +1,35 @@
+import csv
+from types import SimpleNamespace
+
+import pytest
+
+import lead_score_flow.main as main
+from stubs import StubPool, StubScoreCrew
+
+
+def write_leads(leads_file, count):
+    with open(leads_file, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["id", "name", "email", "bio", "skills"])
+        for candidate_id in range(1, count + 1):
+            writer.writerow(
+                [candidate_id, f"Lead {candidate_id}", "", "Bio", "React, Python"]
+            )
+
+
+@pytest.fixture
+def run_dirs(tmp_path, monkeypatch):
+    leads_file = tmp_path / "leads.csv"
+    write_leads(leads_file, 6)
+
+    monkeypatch.setattr(main, "RUNS_DIR", tmp_path / "runs")
+    monkeypatch.setattr(main, "EMAIL_RESPONSES_DIR", tmp_path / "emails")
+    monkeypatch.setattr(main, "lead_score_crews", StubPool(StubScoreCrew()))
+    # Stub calls are free, only the concurrency limit applies
+    monkeypatch.setattr(main, "SCORING_REQUESTS_PER_MINUTE", {})
+    monkeypatch.setattr(main, "SCORING_DEFAULT_REQUESTS_PER_MINUTE", 60_000)
+    return SimpleNamespace(
+        leads_file=str(leads_file),
+        score_cache_file=str(tmp_path / "score_cache.db"),
+        emails=tmp_path / "emails",
+    )
@@ -0,0 +1,77 @@
+import asyncio
+from types import SimpleNamespace
+
+from lead_score_flow.types import CandidateScore
+
+
+class Killed(BaseException):
+    """Stands in for the process being killed, it is never retried."""
+
+
+class InFlight:
+    """Counts the model calls running at once across every stub crew."""
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+
+    async def call(self):
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        try:
+            # Let the other workers start their calls meanwhile
+            await asyncio.sleep(0.01)
+        finally:
+            self.current -= 1
+
+
+class StubScoreCrew:
+    def __init__(self, calls=None, kill_after=None, in_flight=None):
+        self.calls = [] if calls is None else calls
+        self.kill_after = kill_after
+        self.in_flight = in_flight
+
+    async def kickoff_async(self, inputs):
+        if self.kill_after is not None and len(self.calls) >= self.kill_after:
+            raise Killed()
+        candidate_id = inputs["candidate_id"]
+        self.calls.append(candidate_id)
+        if self.in_flight is not None:
+            await self.in_flight.call()
+        return SimpleNamespace(
+            pydantic=CandidateScore(
+                id=candidate_id, score=int(candidate_id) * 10, reason="stub"
+            )
+        )
+
+
+class EmptyBatchScoreCrew:
+    """Batch crew whose responses never contain any score."""
+
+    def __init__(self, in_flight=None):
+        self.in_flight = in_flight
+
+    async def kickoff_async(self, inputs):
+        if self.in_flight is not None:
+            await self.in_flight.call()
+        return SimpleNamespace(pydantic=None)
+
+
+class StubResponseCrew:
+    def __init__(self, calls, kill_after=None):
+        self.calls = calls
+        self.kill_after = kill_after
+
+    async def kickoff_async(self, inputs):
+        if self.kill_after is not None and len(self.calls) >= self.kill_after:
+            raise Killed()
+        self.calls.append((inputs["candidate_id"], inputs["proceed_with_candidate"]))
+        return SimpleNamespace(raw=f"Email for {inputs['name']}")
+
+
+class StubPool:
+    def __init__(self, crew):
+        self.crew = crew
+
+    def get(self):
+        return self.crew
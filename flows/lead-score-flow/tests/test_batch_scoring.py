@@ -0,0 +1,42 @@
+import lead_score_flow.main as main
+from conftest import write_leads
+from stubs import (
+    EmptyBatchScoreCrew,
+    InFlight,
+    StubPool,
+    StubResponseCrew,
+    StubScoreCrew,
+)
+
+
+def test_candidates_missing_from_a_batch_keep_the_concurrency_limit(
+    run_dirs, monkeypatch
+):
+    write_leads(run_dirs.leads_file, 20)
+    in_flight = InFlight()
+    score_calls = []
+    monkeypatch.setattr(
+        main,
+        "lead_score_crews",
+        StubPool(StubScoreCrew(score_calls, in_flight=in_flight)),
+    )
+    monkeypatch.setattr(
+        main, "lead_batch_score_crews", StubPool(EmptyBatchScoreCrew(in_flight))
+    )
+    monkeypatch.setattr(main, "lead_response_crews", StubPool(StubResponseCrew([])))
+
+    flow = main.LeadScoreFlow()
+    flow.kickoff(
+        inputs={
+            "leads_file": run_dirs.leads_file,
+            "score_cache_file": run_dirs.score_cache_file,
+            "scoring_max_concurrency": 2,
+            "scoring_batch_size": 10,
+            "review_policy": {"interactive": False},
+        }
+    )
+
+    # Both batches came back empty, so every lead was scored on its own
+    assert sorted(score_calls, key=int) == [str(i) for i in range(1, 21)]
+    assert in_flight.peak == 2
+    assert [score.id for score in flow.state.top_candidate_scores] == ["20", "19", "18"]
@@ -0,0 +1,36 @@
+import csv
+
+import lead_score_flow.main as main
+from stubs import StubPool, StubResponseCrew
+
+
+def test_emails_that_cannot_be_saved_are_skipped_without_rerunning_the_crew(
+    run_dirs, monkeypatch
+):
+    # Streamed leads aren't deduplicated. The second copy of a lead gets its
+    # id added to the filename, the third finds that filename taken too.
+    with open(run_dirs.leads_file, "a", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        for candidate_id in [6, 6, 1, 1]:
+            writer.writerow(
+                [candidate_id, f"Lead {candidate_id}", "", "Bio", "React, Python"]
+            )
+    response_calls = []
+    monkeypatch.setattr(
+        main, "lead_response_crews", StubPool(StubResponseCrew(response_calls))
+    )
+
+    flow = main.LeadScoreFlow()
+    flow.kickoff(
+        inputs={
+            "leads_file": run_dirs.leads_file,
+            "score_cache_file": run_dirs.score_cache_file,
+            "stream_leads": True,
+            "review_policy": {"interactive": False},
+        }
+    )
+
+    # One crew call per row for lead 6, the failed save isn't retried
+    assert [call for call in response_calls if call[0] == "6"] == [("6", True)] * 3
+    # The template rejection that failed didn't stop the other emails
+    assert len(list(run_dirs.emails.glob("*.txt"))) == 8
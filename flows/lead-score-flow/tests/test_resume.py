@@ -0,0 +1,74 @@
+import lead_score_flow.main as main
+from stubs import Killed, StubPool, StubResponseCrew, StubScoreCrew
+
+
+def kickoff(run_dirs, monkeypatch, response_crew, run_id=None, score_cache_file=None):
+    monkeypatch.setattr(main, "lead_response_crews", StubPool(response_crew))
+    inputs = {
+        "leads_file": run_dirs.leads_file,
+        "score_cache_file": score_cache_file or run_dirs.score_cache_file,
+        "top_k": 3,
+        "scoring_max_concurrency": 1,
+        "review_policy": {"interactive": False, "min_score": 50, "max_rounds": 1},
+    }
+    if run_id:
+        inputs["run_id"] = run_id
+    flow = main.LeadScoreFlow()
+    try:
+        flow.kickoff(inputs=inputs)
+    except Killed:
+        pass
+    return flow
+
+
+def test_resumed_auto_run_only_invites_candidates_the_policy_kept(
+    run_dirs, monkeypatch
+):
+    # Top 3 are leads 6, 5 and 4, only 6 and 5 reach the minimum score of 50
+    first_calls = []
+    first = kickoff(run_dirs, monkeypatch, StubResponseCrew(first_calls, kill_after=1))
+    assert len(first_calls) == 1
+
+    resumed_calls = []
+    resumed = kickoff(
+        run_dirs, monkeypatch, StubResponseCrew(resumed_calls), first.state.run_id
+    )
+
+    # Only the invitation that wasn't saved before the kill is written
+    assert sorted(first_calls + resumed_calls) == [("5", True), ("6", True)]
+    assert [c.id for c in resumed.state.hydrated_candidates] == ["6", "5"]
+    assert resumed.state.scoring_round == 1
+    # Lead 4 made the top 3 but was rejected, it keeps its template email
+    rejection = (run_dirs.emails / "Lead 4.txt").read_text()
+    assert "move forward with other candidates" in rejection
+    assert len(list(run_dirs.emails.glob("*.txt"))) == 6
+
+
+def test_resumed_run_only_scores_candidates_missing_from_the_journal(
+    run_dirs, monkeypatch, tmp_path
+):
+    first_calls = []
+    monkeypatch.setattr(
+        main, "lead_score_crews", StubPool(StubScoreCrew(first_calls, kill_after=3))
+    )
+    first = kickoff(run_dirs, monkeypatch, StubResponseCrew([]))
+    assert first_calls == ["1", "2", "3"]
+
+    resumed_calls = []
+    monkeypatch.setattr(
+        main, "lead_score_crews", StubPool(StubScoreCrew(resumed_calls))
+    )
+    # A fresh cache, so only the journal knows which leads were scored
+    resumed = kickoff(
+        run_dirs,
+        monkeypatch,
+        StubResponseCrew([]),
+        first.state.run_id,
+        score_cache_file=str(tmp_path / "fresh_score_cache.db"),
+    )
+
+    assert resumed_calls == ["4", "5", "6"]
+    assert resumed.state.scored_leads == 6
+    assert resumed.state.scoring_round == 1
+    assert [c.id for c in resumed.state.hydrated_candidates] == ["6", "5"]
+    assert len(list(run_dirs.emails.glob("*.txt"))) == 6
@@ -0,0 +1,31 @@
+from lead_score_flow.types import CandidateScore
+from lead_score_flow.utils.run_journal import RunJournal
+
+
+def score(candidate_id: str) -> CandidateScore:
+    return CandidateScore(id=candidate_id, score=50, reason="stub")
+
+
+def test_only_scores_for_the_latest_feedback_are_resumed(tmp_path):
+    with RunJournal(tmp_path, "run") as journal:
+        journal.record_score("", score("1"))
+        journal.record_feedback("more React")
+        journal.record_score("more React", score("2"))
+        # Scores recorded in this run are written, not kept in memory
+        assert journal.scores("more React") == {}
+
+    with RunJournal(tmp_path, "run") as journal:
+        assert list(journal.scores("more React")) == ["2"]
+        assert journal.scores("") == {}
+
+
+def test_scores_returns_a_copy(tmp_path):
+    with RunJournal(tmp_path, "run") as journal:
+        journal.record_score("", score("1"))
+
+    with RunJournal(tmp_path, "run") as journal:
+        resumed = journal.scores("")
+        journal.record_score("", score("2"))
+        resumed["3"] = score("3")
+        assert list(resumed) == ["1", "3"]
+        assert list(journal.scores("")) == ["1"]
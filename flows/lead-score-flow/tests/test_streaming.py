@@ -0,0 +1,23 @@
+import lead_score_flow.main as main
+from stubs import StubPool, StubResponseCrew
+
+
+def test_streamed_run_keeps_only_the_leaderboard_in_state(run_dirs, monkeypatch):
+    monkeypatch.setattr(main, "lead_response_crews", StubPool(StubResponseCrew([])))
+
+    flow = main.LeadScoreFlow()
+    flow.kickoff(
+        inputs={
+            "leads_file": run_dirs.leads_file,
+            "score_cache_file": run_dirs.score_cache_file,
+            "stream_leads": True,
+            "review_policy": {"interactive": False},
+        }
+    )
+
+    assert len(flow.state.candidates) == 0
+    assert len(flow.state.candidate_score) == 0
+    assert flow.state.scored_leads == 6
+    assert [score.id for score in flow.state.top_candidate_scores] == ["6", "5", "4"]
+    # Every scored lead still gets an email, looked up in the score cache
+    assert len(list(run_dirs.emails.glob("*.txt"))) == 6
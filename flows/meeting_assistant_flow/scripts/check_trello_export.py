@@ -0,0 +1,131 @@
+"""
+Export tasks to a local stub of the Trello API and check for duplicate cards.
+
+The stub answers every 10th card creation with a 429 whose `Retry-After` is
+a number of seconds, an HTTP date or garbage, in turn. Every 25th creation
+makes the card and then returns a 502, like a gateway timing out after
+Trello did the work. Every 40th stalls past the client timeout without
+making the card. The export then runs a second time, which must skip every
+task. Run from the project root:
+
+    uv run python scripts/check_trello_export.py --tasks 500
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import threading
+import time
+from collections import Counter
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from meeting_assistant_flow.types import MeetingTask
+from meeting_assistant_flow.utils.trello_helper import TrelloExporter
+
+CLIENT_TIMEOUT = 0.5
+
+
+class StubTrello(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    cards = []
+    posts = itertools.count(1)
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def send_json(self, status: int, body, headers: dict = {}):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        with self.lock:
+            cards = [
+                {"name": card["name"], "desc": card["desc"]} for card in self.cards
+            ]
+        self.send_json(200, cards)
+
+    def do_POST(self):
+        with self.lock:
+            post = next(self.posts)
+        if post % 10 == 0:
+            retry_after = ["0.05", formatdate(time.time() + 1, usegmt=True), "soon"]
+            return self.send_json(
+                429, {"error": "rate limited"}, {"Retry-After": retry_after[post % 3]}
+            )
+        if post % 40 == 1:
+            time.sleep(CLIENT_TIMEOUT * 20)
+            self.close_connection = True
+            return
+
+        query = {
+            key: values[0]
+            for key, values in parse_qs(urlparse(self.path).query).items()
+        }
+        with self.lock:
+            self.cards.append(query)
+            card_id = str(len(self.cards))
+        if post % 25 == 0:
+            return self.send_json(502, {"error": "bad gateway"})
+        self.send_json(200, {"id": card_id})
+
+
+def export(exporter: TrelloExporter, tasks) -> tuple:
+    started_at = time.perf_counter()
+    # The exporter prints a line per card
+    with contextlib.redirect_stdout(io.StringIO()):
+        summary = exporter.export(tasks)
+    return summary, time.perf_counter() - started_at
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubTrello)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    tasks = [
+        MeetingTask(name=f"Task {number}", description=f"Follow up on item {number}")
+        for number in range(args.tasks)
+    ]
+    exporter = TrelloExporter(
+        "key",
+        "token",
+        "list",
+        base_url=f"http://127.0.0.1:{server.server_port}/1",
+        max_workers=args.workers,
+        backoff_seconds=0.05,
+        timeout=CLIENT_TIMEOUT,
+    )
+    try:
+        first, first_elapsed = export(exporter, tasks)
+        second, second_elapsed = export(exporter, tasks)
+    finally:
+        exporter.close()
+        server.shutdown()
+
+    names = Counter(card["name"] for card in StubTrello.cards)
+    duplicates = sum(count - 1 for count in names.values())
+    print(f"Exporting {args.tasks} tasks with {args.workers} workers")
+    print(f"  first run   {first} in {first_elapsed:.1f}s")
+    print(f"  second run  {second} in {second_elapsed:.1f}s")
+    print(f"  cards on the list: {len(StubTrello.cards)}, duplicates: {duplicates}")
+    if duplicates or second["created"] or second["skipped"] != args.tasks:
+        raise SystemExit("Export check failed")
+    print("Export check passed")
+
+
+if __name__ == "__main__":
+    main()
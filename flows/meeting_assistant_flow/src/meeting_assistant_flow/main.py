@@ -1,7 +1,9 @@
 #!/usr/bin/env python
+import asyncio
 import csv
 import os
-from typing import List
+import time
+from typing import Dict, List
 
 from crewai.flow.flow import Flow, listen, start
 from pydantic import BaseModel
@@ -17,6 +19,18 @@ from meeting_assistant_flow.utils.trello_helper import save_tasks_to_trello
 class MeetingState(BaseModel):
     transcript: str = "Meeting transcript goes here"
     tasks: List[MeetingTask] = []
+    sink_seconds: Dict[str, float] = {}
+    sink_errors: Dict[str, str] = {}
+
+
+def write_tasks_to_csv(tasks: List[MeetingTask], filename: str):
+    with open(filename, "w", newline="") as file:
+        writer = csv.writer(file)
+        # Write the header row
+        writer.writerow(["Name", "Description"])
+        # Write the task data
+        for task in tasks:
+            writer.writerow([task.name, task.description])
 
 
 class MeetingFlow(Flow[MeetingState]):
@@ -43,27 +57,41 @@ class MeetingFlow(Flow[MeetingState]):
         print("TASKS:", tasks)
         self.state.tasks = tasks
 
+    async def run_sink(self, name, func, *args):
+        """
+        Run a blocking exporter on a worker thread and time it.
+
+        The sinks all listen to the same step and run concurrently, so a slow
+        sink never delays the others. A failing sink is recorded in the state
+        instead of raising, so it can't stop the other sinks either.
+        """
+        started_at = time.monotonic()
+        try:
+            await asyncio.to_thread(func, *args)
+        except Exception as e:
+            self.state.sink_errors[name] = str(e)
+            print(f"Sink {name} failed: {e}")
+        elapsed = time.monotonic() - started_at
+        self.state.sink_seconds[name] = elapsed
+        print(f"Sink {name} finished in {elapsed:.2f}s")
+
     @listen(generate_tasks_from_meeting_transcript)
-    def add_tasks_to_trello(self):
+    async def add_tasks_to_trello(self):
         print("Adding Tasks to Trello")
-        save_tasks_to_trello(self.state.tasks)
+        await self.run_sink("trello", save_tasks_to_trello, self.state.tasks)
 
     @listen(generate_tasks_from_meeting_transcript)
-    def save_new_tasks_to_csv(self):
+    async def save_new_tasks_to_csv(self):
         print("Saving New Tasks to CSV")
-        with open("new_tasks.csv", "w", newline="") as file:
-            writer = csv.writer(file)
-            # Write the header row
-            writer.writerow(["Name", "Description"])
-            # Write the task data
-            for task in self.state.tasks:
-                writer.writerow([task.name, task.description])
+        await self.run_sink(
+            "csv", write_tasks_to_csv, self.state.tasks, "new_tasks.csv"
+        )
 
     @listen(generate_tasks_from_meeting_transcript)
-    def send_slack_notification(self):
+    async def send_slack_notification(self):
         print("Sending Slack Notification")
         message = f"{len(self.state.tasks)} New tasks have been added to Trello!"
-        send_message_to_channel(message)
+        await self.run_sink("slack", send_message_to_channel, message)
 
 
 def kickoff():
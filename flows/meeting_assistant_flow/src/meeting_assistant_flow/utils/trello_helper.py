@@ -1,8 +1,16 @@
+import hashlib
 import os
-from typing import List
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Optional
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 from meeting_assistant_flow.types import MeetingTask
 
@@ -17,47 +25,188 @@ TOKEN = os.getenv("TRELLO_TOKEN")
 BOARD_ID = os.getenv("TRELLO_BOARD_ID")
 LIST_ID = os.getenv("TRELLO_LIST_ID")
 
+TRELLO_API_URL = "https://api.trello.com/1"
 
-def create_trello_card(task_title, task_description):
-    """
-    Create a new card in Trello for the given task.
 
-    :param task_title: Title of the task (will be the title of the Trello card)
-    :param task_description: Detailed description of the task (will be the body of the Trello card)
-    :return: Response object from Trello API call
+class TrelloExporter:
+    """
+    Creates Trello cards in bulk over one pooled HTTP session.
+
+    Up to `max_workers` cards are created at once. Requests that hit Trello's
+    rate limit (429), fail to connect or get no answer within `timeout`
+    seconds are retried with exponential backoff, honouring `Retry-After`. Reads are also retried on server errors, but card
+    creation is not, since Trello may have created the card before a 502 or
+    504 came back. Each task gets an idempotency key from its name
+    and description, and tasks whose card already exists in the list are
+    skipped, so rerunning an export never creates duplicate cards.
     """
-    url = "https://api.trello.com/1/cards"
-
-    query = {
-        "key": API_KEY,
-        "token": TOKEN,
-        "idList": LIST_ID,
-        "name": task_title,
-        "desc": task_description,
-    }
-
-    response = requests.post(url, params=query)
-
-    if response.status_code == 200:
-        print(f"Task '{task_title}' successfully created in Trello.")
-    else:
-        print(f"Failed to create task '{task_title}' in Trello.")
-        print(response.text)
-
-    return response
-
 
-def save_tasks_to_trello(tasks: List[MeetingTask]):
+    def __init__(
+        self,
+        api_key: str,
+        token: str,
+        list_id: str,
+        base_url: str = TRELLO_API_URL,
+        max_workers: int = 8,
+        max_retries: int = 5,
+        backoff_seconds: float = 0.5,
+        timeout: float = 10,
+    ):
+        self.list_id = list_id
+        self.base_url = base_url
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.timeout = timeout
+        self.auth = {"key": api_key, "token": token}
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def idempotency_key(name: str, description: str) -> str:
+        payload = f"{name}\0{description}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def request(self, method: str, path: str, **params) -> requests.Response:
+        retry_server_errors = method == "GET"
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.request(
+                    method,
+                    f"{self.base_url}{path}",
+                    params={**self.auth, **params},
+                    timeout=self.timeout,
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+                response = None
+            else:
+                retryable = response.status_code == 429 or (
+                    retry_server_errors and response.status_code >= 500
+                )
+                if not retryable or attempt == self.max_retries:
+                    return response
+
+            with self._lock:
+                self.retries += 1
+            delay = self.retry_delay(response, attempt)
+            time.sleep(delay * random.uniform(1.0, 1.5))
+
+    def retry_delay(self, response: Optional[requests.Response], attempt: int) -> float:
+        """
+        Seconds to wait before the next attempt, from `Retry-After` if present.
+
+        `Retry-After` is either a number of seconds or an HTTP date. Anything
+        unparseable falls back to exponential backoff.
+        """
+        backoff = self.backoff_seconds * 2**attempt
+        retry_after = None if response is None else response.headers.get("Retry-After")
+        if retry_after is None:
+            return backoff
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return backoff
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def existing_keys(self) -> set:
+        response = self.request(
+            "GET", f"/lists/{self.list_id}/cards", fields="name,desc"
+        )
+        response.raise_for_status()
+        return {
+            self.idempotency_key(card["name"], card["desc"])
+            for card in response.json()
+        }
+
+    def create_card(self, task: MeetingTask) -> Optional[dict]:
+        try:
+            response = self.request(
+                "POST",
+                "/cards",
+                idList=self.list_id,
+                name=task.name,
+                desc=task.description,
+            )
+        except requests.RequestException as e:
+            print(f"Failed to create task '{task.name}' in Trello: {e}")
+            return None
+        if response.status_code == 200:
+            print(f"Task '{task.name}' successfully created in Trello.")
+            return response.json()
+
+        print(f"Failed to create task '{task.name}' in Trello.")
+        print(response.text)
+        return None
+
+    def export(self, tasks: List[MeetingTask]) -> dict:
+        """
+        Create a card for every task that isn't in the list yet.
+
+        Returns how many cards were created, skipped and failed.
+        """
+        self.retries = 0
+        seen = self.existing_keys()
+        pending = []
+        skipped = 0
+        for task in tasks:
+            if not (task.name and task.description):
+                print("Task is missing a title or description. Skipping...")
+                skipped += 1
+                continue
+
+            key = self.idempotency_key(task.name, task.description)
+            if key in seen:
+                print(f"Task '{task.name}' is already in Trello. Skipping...")
+                skipped += 1
+                continue
+            seen.add(key)
+            pending.append(task)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            cards = list(executor.map(self.create_card, pending))
+
+        created = sum(card is not None for card in cards)
+        return {
+            "created": created,
+            "skipped": skipped,
+            "failed": len(cards) - created,
+            "retries": self.retries,
+        }
+
+    def close(self):
+        self.session.close()
+
+
+def save_tasks_to_trello(tasks: List[MeetingTask], max_workers: int = 8) -> dict:
     """
-    Save a list of tasks to Trello. Each task is a dictionary with 'title' and 'body'.
+    Save a list of tasks to Trello, skipping tasks already on the list.
 
-    :param tasks: List of tasks, where each task is a dict with 'title' and 'body'
+    :param tasks: List of tasks, each with a name and a description
+    :param max_workers: How many cards to create at the same time
+    :return: How many cards were created, skipped and failed
     """
-    for task in tasks:
-        if task.name and task.description:
-            create_trello_card(task.name, task.description)
-        else:
-            print("Task is missing a title or description. Skipping...")
+    exporter = TrelloExporter(API_KEY, TOKEN, LIST_ID, max_workers=max_workers)
+    try:
+        summary = exporter.export(tasks)
+    finally:
+        exporter.close()
+    print(
+        f"Trello export: {summary['created']} created, {summary['skipped']} "
+        f"skipped, {summary['failed']} failed, {summary['retries']} retries"
+    )
+    return summary
 
 
 # Example usage
@@ -0,0 +1,79 @@
+"""
+Count the outline tokens the chapter prompts get for a generated outline.
+
+Compares the previous input, a model_dump_json() of every chapter in the
+book, against the OutlineDigest each chapter now gets. Both are rendered the
+way crewAI interpolates them into the research and write tasks, and counted
+with the cl100k_base encoding. No model is called. Run from the project root:
+
+    uv run python scripts/bench_outline_tokens.py --chapters 30
+"""
+
+import argparse
+
+import tiktoken
+from crewai.utilities.string_utils import interpolate_only
+
+from write_a_book_with_flows.types import ChapterOutline
+from write_a_book_with_flows.utils.outline_digest import OutlineDigest
+
+# {book_outline} appears in both the research and the write task
+TASKS_WITH_OUTLINE = 2
+DESCRIPTION = (
+    "This chapter examines how organisations in the sector adopted AI during "
+    "the last year, which tools and models they rely on, the measurable impact "
+    "on cost and quality, the regulatory questions that came up along the way, "
+    "and the open problems practitioners still report. It closes with case "
+    "studies and a short outlook on what to expect in the next twelve months."
+)
+
+
+def make_outline(chapters: int):
+    return [
+        ChapterOutline(
+            title=f"AI in Industry {number}: Adoption, Impact and Outlook",
+            description=DESCRIPTION,
+        )
+        for number in range(1, chapters + 1)
+    ]
+
+
+def count_tokens(encoding, book_outline) -> int:
+    prompt = interpolate_only("{book_outline}", {"book_outline": book_outline})
+    return len(encoding.encode(prompt))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chapters", type=int, default=30)
+    parser.add_argument("--window", type=int, default=1)
+    args = parser.parse_args()
+
+    encoding = tiktoken.get_encoding("cl100k_base")
+    outline = make_outline(args.chapters)
+    digest = OutlineDigest(outline, window=args.window)
+
+    full_tokens = []
+    digest_tokens = []
+    for index in range(len(outline)):
+        full_outline = [chapter.model_dump_json() for chapter in outline]
+        full_tokens.append(count_tokens(encoding, full_outline))
+        digest_tokens.append(count_tokens(encoding, digest.for_chapter(index)))
+
+    print(
+        f"Outline tokens for {args.chapters} chapters, "
+        f"{TASKS_WITH_OUTLINE} tasks per chapter"
+    )
+    for label, tokens in [
+        ("full outline", full_tokens),
+        (f"digest, window {args.window}", digest_tokens),
+    ]:
+        print(
+            f"  {label:<18} largest chapter={max(tokens):<6} "
+            f"book={sum(tokens) * TASKS_WITH_OUTLINE}"
+        )
+    print(f"Outline tokens saved: {1 - sum(digest_tokens) / sum(full_tokens):.0%}")
+
+
+if __name__ == "__main__":
+    main()
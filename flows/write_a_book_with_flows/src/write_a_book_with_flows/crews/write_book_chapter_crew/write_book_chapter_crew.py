@@ -2,6 +2,7 @@ from crewai import Agent, Crew, Process, Task, LLM
 from crewai.project import CrewBase, agent, crew, task
 from crewai_tools import SerperDevTool
 
+from write_a_book_with_flows.tools.cached_search_tool import CachedSerperDevTool
 from write_a_book_with_flows.types import Chapter
 
 
@@ -13,9 +14,17 @@ class WriteBookChapterCrew:
     tasks_config = "config/tasks.yaml"
     llm = LLM(model="gpt-4o")
 
+    def __init__(self, research_cache=None):
+        # Set before CrewBase builds the agents, so the researcher sees it.
+        # Pass one cache per book so every chapter shares it.
+        self.research_cache = research_cache
+
     @agent
     def researcher(self) -> Agent:
-        search_tool = SerperDevTool()
+        if self.research_cache is None:
+            search_tool = SerperDevTool()
+        else:
+            search_tool = CachedSerperDevTool(cache=self.research_cache)
         return Agent(
             config=self.agents_config["researcher"],
             tools=[search_tool],
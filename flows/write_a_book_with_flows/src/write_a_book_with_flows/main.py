@@ -1,5 +1,8 @@
 #!/usr/bin/env python
+import argparse
 import asyncio
+import time
+from pathlib import Path
 from typing import List
 
 from crewai.flow.flow import Flow, listen, start
@@ -9,6 +12,10 @@ from write_a_book_with_flows.crews.write_book_chapter_crew.write_book_chapter_cr
     WriteBookChapterCrew,
 )
 from write_a_book_with_flows.types import Chapter, ChapterOutline
+from write_a_book_with_flows.utils.book_writer import OrderedBookWriter
+from write_a_book_with_flows.utils.chapter_store import ChapterStore, book_slug
+from write_a_book_with_flows.utils.outline_digest import OutlineDigest
+from write_a_book_with_flows.utils.research_cache import ResearchCache
 
 from write_a_book_with_flows.crews.outline_book_crew.outline_crew import OutlineCrew
 
@@ -18,6 +25,12 @@ class BookState(BaseModel):
     title: str = "The Current State of AI in July 2025"
     book: List[Chapter] = []
     book_outline: List[ChapterOutline] = []
+    max_concurrent_chapters: int = 5
+    book_filename: str = ""
+    research_cache_ttl: float = 3600
+    outline_context_window: int = 1
+    resume: bool = False
+    artifacts_dir: str = "./chapters"
     topic: str = (
         "Exploring the latest trends in AI across different industries as of July 2025"
     )
@@ -32,8 +45,24 @@ class BookState(BaseModel):
 class BookFlow(Flow[BookState]):
     initial_state = BookState
 
+    def chapter_store(self) -> ChapterStore:
+        return ChapterStore(
+            Path(self.state.artifacts_dir) / book_slug(self.state.title),
+            topic=self.state.topic,
+            goal=self.state.goal,
+        )
+
     @start()
     def generate_book_outline(self):
+        store = self.chapter_store()
+        if self.state.resume:
+            # Reuse the saved outline, including any edits made to it by hand
+            chapters = store.load_outline()
+            if chapters is not None:
+                print(f"Resuming with the saved outline from {store.outline_path}")
+                self.state.book_outline = chapters
+                return chapters
+
         print("Kickoff the Book Outline Crew")
         output = (
             OutlineCrew()
@@ -45,78 +74,118 @@ class BookFlow(Flow[BookState]):
         print("Chapters:", chapters)
 
         self.state.book_outline = chapters
+        store.save_outline(self.state.book_outline)
         return chapters
 
     @listen(generate_book_outline)
     async def write_chapters(self):
         print("Writing Book Chapters")
-        tasks = []
-
-        async def write_single_chapter(chapter_outline):
-            output = (
-                WriteBookChapterCrew()
-                .crew()
-                .kickoff(
+        # Limits how many chapter crews run at the same time
+        semaphore = asyncio.Semaphore(self.state.max_concurrent_chapters)
+        started_at = time.monotonic()
+        chapter_seconds = []
+
+        # Chapters are appended to the book file in outline order as they finish
+        self.state.book_filename = f"./{self.state.title.replace(' ', '_')}.md"
+        book_writer = OrderedBookWriter(self.state.book_filename)
+        research_cache = ResearchCache(ttl_seconds=self.state.research_cache_ttl)
+        # The outline is rendered once, each chapter gets a digest around itself
+        outline_digest = OutlineDigest(
+            self.state.book_outline, window=self.state.outline_context_window
+        )
+        # Every finished chapter is saved so a failed run can be resumed
+        store = self.chapter_store()
+
+        async def write_single_chapter(index, chapter_outline):
+            async with semaphore:
+                chapter_started_at = time.monotonic()
+                chapter_crew = WriteBookChapterCrew(research_cache=research_cache)
+                output = await chapter_crew.crew().kickoff_async(
                     inputs={
                         "goal": self.state.goal,
                         "topic": self.state.topic,
                         "chapter_title": chapter_outline.title,
                         "chapter_description": chapter_outline.description,
-                        "book_outline": [
-                            chapter_outline.model_dump_json()
-                            for chapter_outline in self.state.book_outline
-                        ],
+                        "book_outline": outline_digest.for_chapter(index),
                     }
                 )
-            )
+                elapsed = time.monotonic() - chapter_started_at
+
+            chapter_seconds.append(elapsed)
+            print(f"Finished Chapter: {chapter_outline.title} in {elapsed:.1f}s")
             title = output["title"]
             content = output["content"]
             chapter = Chapter(title=title, content=content)
+            store.save_chapter(index, chapter_outline, chapter)
+            book_writer.add(index, chapter)
             return chapter
 
-        for chapter_outline in self.state.book_outline:
+        reused_chapters = {}
+        tasks = {}
+        for index, chapter_outline in enumerate(self.state.book_outline):
+            if self.state.resume:
+                chapter = store.load_chapter(index, chapter_outline)
+                if chapter is not None:
+                    print(f"Reusing saved Chapter: {chapter_outline.title}")
+                    book_writer.add(index, chapter)
+                    reused_chapters[index] = chapter
+                    continue
+
             print(f"Writing Chapter: {chapter_outline.title}")
             print(f"Description: {chapter_outline.description}")
             # Schedule each chapter writing task
-            task = asyncio.create_task(write_single_chapter(chapter_outline))
-            tasks.append(task)
+            task = asyncio.create_task(write_single_chapter(index, chapter_outline))
+            tasks[index] = task
 
         # Await all chapter writing tasks concurrently
-        chapters = await asyncio.gather(*tasks)
-        print("Newly generated chapters:", chapters)
-        self.state.book.extend(chapters)
-
-        print("Book Chapters", self.state.book)
+        with book_writer:
+            # Let every chapter finish so the ones that succeeded are saved
+            results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        written_chapters = {
+            index: result
+            for index, result in zip(tasks, results)
+            if isinstance(result, Chapter)
+        }
+        chapters = list(written_chapters.values())
+        failures = [result for result in results if isinstance(result, BaseException)]
+        print("Newly generated chapters:", [chapter.title for chapter in chapters])
+        print(
+            f"Reused {len(reused_chapters)} saved chapters, "
+            f"regenerated {len(chapters)}, failed {len(failures)}"
+        )
+        if failures:
+            print(f"Saved chapters are in {store.directory}, rerun with --resume")
+            raise failures[0]
+        book_chapters = {**reused_chapters, **written_chapters}
+        self.state.book.extend(book_chapters[index] for index in sorted(book_chapters))
+
+        wall_time = time.monotonic() - started_at
+        print(
+            f"Wrote {len(chapters)} chapters in {wall_time:.1f}s "
+            f"({sum(chapter_seconds):.1f}s of chapter time, "
+            f"up to {self.state.max_concurrent_chapters} at once)"
+        )
+        print("Research cache:", research_cache.summary())
 
     @listen(write_chapters)
     async def join_and_save_chapter(self):
-        print("Joining and Saving Book Chapters")
-        # Combine all chapters into a single markdown string
-        book_content = ""
-
-        for chapter in self.state.book:
-            # Add the chapter title as an H1 heading
-            book_content += f"# {chapter.title}\n\n"
-            # Add the chapter content
-            book_content += f"{chapter.content}\n\n"
-
-        # The title of the book from self.state.title
-        book_title = self.state.title
-
-        # Create the filename by replacing spaces with underscores and adding .md extension
-        filename = f"./{book_title.replace(' ', '_')}.md"
-
-        # Save the combined content into the file
-        with open(filename, "w", encoding="utf-8") as file:
-            file.write(book_content)
-
-        print(f"Book saved as {filename}")
-        return book_content
+        # Chapters were already streamed to the file while they were written
+        print("Book Chapters:", [chapter.title for chapter in self.state.book])
+        print(f"Book saved as {self.state.book_filename}")
+        return self.state.book_filename
 
 
 def kickoff():
+    parser = argparse.ArgumentParser(description="Write a book with crewAI flows")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reuse the saved outline and chapters from a previous run",
+    )
+    args, _ = parser.parse_known_args()
+
     poem_flow = BookFlow()
-    poem_flow.kickoff()
+    poem_flow.kickoff(inputs={"resume": args.resume})
 
 
 def plot():
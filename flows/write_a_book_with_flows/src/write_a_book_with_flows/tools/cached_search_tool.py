@@ -0,0 +1,23 @@
+from crewai_tools import SerperDevTool
+from pydantic import ConfigDict
+
+from write_a_book_with_flows.utils.research_cache import ResearchCache
+
+
+class CachedSerperDevTool(SerperDevTool):
+    """SerperDevTool that answers repeated searches from a shared ResearchCache."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    cache: ResearchCache
+
+    def _run(self, **kwargs):
+        search_query = kwargs.get("search_query") or kwargs.get("query", "")
+        options = {
+            name: value
+            for name, value in kwargs.items()
+            if name not in ("search_query", "query")
+        }
+        key = ResearchCache.normalize(search_query, **options)
+        search = super()._run
+        return self.cache.get_or_fetch(key, lambda: search(**kwargs))
@@ -0,0 +1,38 @@
+from typing import Dict
+
+from write_a_book_with_flows.types import Chapter
+
+
+class OrderedBookWriter:
+    """
+    Streams chapters into the book file in outline order.
+
+    Chapters can finish in any order. Each one is held in a reorder buffer
+    until every chapter before it has been written, then appended and flushed,
+    so the file on disk is always a readable prefix of the book.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.chapters_written = 0
+        self._pending: Dict[int, Chapter] = {}
+        self._file = open(filename, "w", encoding="utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, index: int, chapter: Chapter):
+        self._pending[index] = chapter
+        while self.chapters_written in self._pending:
+            ready = self._pending.pop(self.chapters_written)
+            # Add the chapter title as an H1 heading followed by its content
+            self._file.write(f"# {ready.title}\n\n")
+            self._file.write(f"{ready.content}\n\n")
+            self._file.flush()
+            self.chapters_written += 1
+
+    def close(self):
+        self._file.close()
@@ -0,0 +1,91 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+from write_a_book_with_flows.types import Chapter, ChapterOutline
+
+
+class ChapterStore:
+    """
+    Persists the outline and every finished chapter of a book as JSON artifacts.
+
+    A chapter artifact is keyed by its index and a hash of its own outline
+    entry plus the book's topic and goal. Editing one chapter in the saved
+    outline therefore invalidates only that chapter, and a resumed run
+    regenerates just the chapters that are missing or invalidated.
+    """
+
+    def __init__(self, directory: Path, topic: str, goal: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.topic = topic
+        self.goal = goal
+
+    @property
+    def outline_path(self) -> Path:
+        return self.directory / "outline.json"
+
+    def chapter_key(self, chapter_outline: ChapterOutline) -> str:
+        payload = json.dumps(
+            [self.topic, self.goal, chapter_outline.model_dump()], sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def chapter_path(self, index: int, chapter_outline: ChapterOutline) -> Path:
+        return self.directory / f"{index:03d}-{self.chapter_key(chapter_outline)}.json"
+
+    def load_outline(self) -> Optional[List[ChapterOutline]]:
+        """Return the saved outline if it was made for the same topic and goal."""
+        if not self.outline_path.exists():
+            return None
+
+        saved = json.loads(self.outline_path.read_text(encoding="utf-8"))
+        if saved["topic"] != self.topic or saved["goal"] != self.goal:
+            return None
+        return [ChapterOutline(**chapter) for chapter in saved["chapters"]]
+
+    def save_outline(self, outline: List[ChapterOutline]):
+        payload = {
+            "topic": self.topic,
+            "goal": self.goal,
+            "chapters": [chapter.model_dump() for chapter in outline],
+        }
+        self._write_atomic(self.outline_path, json.dumps(payload, indent=2))
+
+    def load_chapter(
+        self, index: int, chapter_outline: ChapterOutline
+    ) -> Optional[Chapter]:
+        path = self.chapter_path(index, chapter_outline)
+        if not path.exists():
+            return None
+        return Chapter.model_validate_json(path.read_text(encoding="utf-8"))
+
+    def save_chapter(
+        self, index: int, chapter_outline: ChapterOutline, chapter: Chapter
+    ):
+        path = self.chapter_path(index, chapter_outline)
+        self._write_atomic(path, chapter.model_dump_json())
+
+        # Drop artifacts for earlier versions of this chapter's outline
+        for stale in self.directory.glob(f"{index:03d}-*.json"):
+            if stale != path:
+                stale.unlink()
+
+    @staticmethod
+    def _write_atomic(path: Path, content: str):
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def book_slug(title: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_\-]+", "_", title).strip("_")
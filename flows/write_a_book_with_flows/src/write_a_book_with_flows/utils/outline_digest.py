@@ -0,0 +1,35 @@
+from typing import List
+
+from write_a_book_with_flows.types import ChapterOutline
+
+
+class OutlineDigest:
+    """
+    Compact view of the book outline for chapter prompts.
+
+    Every chapter line is rendered once up front. A chapter then sees the full
+    description of the chapters within `window` of it and only the titles of
+    the rest, so prompt size no longer grows with every description in the
+    book.
+    """
+
+    def __init__(self, outline: List[ChapterOutline], window: int = 1):
+        self.window = window
+        self._titles = [
+            f"{number}. {chapter.title}" for number, chapter in enumerate(outline, 1)
+        ]
+        self._details = [
+            f"{title}: {chapter.description}"
+            for title, chapter in zip(self._titles, outline)
+        ]
+
+    def for_chapter(self, index: int) -> str:
+        lines = []
+        for position, (title, details) in enumerate(zip(self._titles, self._details)):
+            if position == index:
+                lines.append(f"{details} (this chapter)")
+            elif abs(position - index) <= self.window:
+                lines.append(details)
+            else:
+                lines.append(title)
+        return "\n".join(lines)
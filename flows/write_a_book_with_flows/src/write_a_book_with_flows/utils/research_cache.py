@@ -0,0 +1,80 @@
+import json
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+
+class ResearchCache:
+    """
+    Book-scoped cache for web searches, shared by every chapter crew.
+
+    Queries are normalized so near-identical searches share one entry, entries
+    expire after `ttl_seconds`, and concurrent requests for a query that is
+    already being fetched wait for that fetch instead of repeating it. Chapter
+    crews run on worker threads, so all bookkeeping happens under a lock.
+    """
+
+    def __init__(self, ttl_seconds: float = 3600):
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.deduplicated = 0
+        self.seconds_saved = 0.0
+        self._entries: Dict[str, Tuple[float, float, Any]] = {}
+        self._in_flight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(query: str, **options) -> str:
+        normalized = re.sub(r"\s+", " ", query).strip().lower().strip("?.!,;:")
+        if not options:
+            return normalized
+        return f"{normalized}|{json.dumps(options, sort_keys=True, default=str)}"
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], Any]) -> Any:
+        waited = False
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and not self._expired(entry):
+                    _, fetch_seconds, result = entry
+                    if waited:
+                        self.deduplicated += 1
+                    else:
+                        self.hits += 1
+                    self.seconds_saved += fetch_seconds
+                    return result
+
+                in_flight = self._in_flight.get(key)
+                if in_flight is None:
+                    in_flight = self._in_flight[key] = threading.Event()
+                    self.misses += 1
+                    break
+
+            # Another chapter is already running this search, wait for its result
+            in_flight.wait()
+            waited = True
+
+        try:
+            started_at = time.monotonic()
+            result = fetch()
+            fetched_at = time.monotonic()
+            with self._lock:
+                self._entries[key] = (fetched_at, fetched_at - started_at, result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            in_flight.set()
+
+    def _expired(self, entry: Tuple[float, float, Any]) -> bool:
+        return time.monotonic() - entry[0] >= self.ttl_seconds
+
+    def summary(self) -> str:
+        lookups = self.hits + self.deduplicated + self.misses
+        hit_rate = (self.hits + self.deduplicated) / lookups if lookups else 0.0
+        return (
+            f"hits={self.hits} deduplicated={self.deduplicated} misses={self.misses} "
+            f"hit_rate={hit_rate:.0%} time_saved={self.seconds_saved:.1f}s"
+        )
@@ -1,4 +1,6 @@
+import os
+
 from src.graph import WorkFlow
 
-app = WorkFlow().app
+app = WorkFlow(os.environ['MY_EMAIL']).app
 app.invoke({})
\ No newline at end of file
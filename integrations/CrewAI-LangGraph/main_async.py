@@ -0,0 +1,17 @@
+import asyncio
+import os
+
+from src.graph import AsyncWorkFlow
+
+def mailboxes():
+	# MY_EMAIL may list several addresses separated by commas, each mailbox
+	# is authorized once and keeps its own token file
+	addresses = [address.strip() for address in os.environ['MY_EMAIL'].split(',')]
+	return [(address, f"token_{address}.json") for address in addresses if address]
+
+async def main():
+	# One graph per mailbox, all waiting on the same event loop
+	apps = [AsyncWorkFlow(address, token_file=token_file).app for address, token_file in mailboxes()]
+	await asyncio.gather(*(app.ainvoke({}) for app in apps))
+
+asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Time the per-iteration overhead of EmailFilterCrew on a stub LLM.
+
+Compares reusing the crew built once in EmailFilterCrew against building the
+tasks and the Crew again on every run of the graph, as the crew did before.
+The stub LLM answers straight away, so the timings are the crewAI overhead
+of an iteration and no API calls are made. Run from the project root:
+
+	python -m scripts.bench_crew_overhead --runs 50
+"""
+import argparse
+import os
+import statistics
+import time
+from functools import partial
+
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+from crewai import Crew, Task
+from crewai.llms.base_llm import BaseLLM
+from crewai.tools import BaseTool
+
+from src.crew import agents, tasks
+from src.crew.crew import EmailFilterCrew
+from src.crew.tasks import EmailFilterTasks
+
+class StubLLM(BaseLLM):
+	def __init__(self):
+		super().__init__(model="stub")
+
+	def call(self, messages, *args, **kwargs):
+		return "Thought: I now can give a great answer\nFinal Answer: done"
+
+	def supports_function_calling(self):
+		return False
+
+class StubTool(BaseTool):
+	name: str = "Stub Tool"
+	description: str = "Never called, the stub LLM answers straight away."
+
+	def _run(self, *args, **kwargs):
+		return ""
+
+def use_stub_tools():
+	# The agents and tasks were written for an older crewAI, which took
+	# LangChain tools and did not require an expected output
+	agents.GmailGetThread = lambda **kwargs: StubTool()
+	agents.TavilySearchResults = lambda **kwargs: StubTool()
+	agents.CreateDraftTool.for_mailbox = staticmethod(lambda api_resource: StubTool())
+	tasks.Task = partial(Task, expected_output="The answer")
+
+def make_emails(run, count):
+	return [
+		{
+			"id": f"{run}-{number}",
+			"threadId": f"thread-{run}-{number}",
+			"snippet": "Can we move our meeting to Thursday?",
+			"sender": f"sender{number}@example.com"
+		}
+		for number in range(count)
+	]
+
+def reused(email_crew):
+	return email_crew.kickoff
+
+def rebuilt(email_crew):
+	def kickoff(state):
+		task_factory = EmailFilterTasks()
+		crew = Crew(
+			agents=[email_crew.filter_agent, email_crew.action_agent, email_crew.writer_agent],
+			tasks=[
+				task_factory.filter_emails_task(email_crew.filter_agent),
+				task_factory.action_required_emails_task(email_crew.action_agent),
+				task_factory.draft_responses_task(email_crew.writer_agent)
+			]
+		)
+		return crew.kickoff(inputs={"emails": email_crew._format_emails(state['emails'])})
+	return kickoff
+
+def time_runs(kickoff, runs, emails_per_run):
+	timings = []
+	for run in range(runs):
+		state = {"emails": make_emails(run, emails_per_run)}
+		started_at = time.perf_counter()
+		kickoff(state)
+		timings.append(time.perf_counter() - started_at)
+	return timings
+
+def report(label, timings):
+	print(
+		f"{label:<18} median={statistics.median(timings) * 1000:.2f}ms "
+		f"mean={statistics.mean(timings) * 1000:.2f}ms total={sum(timings):.2f}s"
+	)
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+	parser.add_argument("--runs", type=int, default=50)
+	parser.add_argument("--emails", type=int, default=10, help="emails per run")
+	args = parser.parse_args()
+
+	use_stub_tools()
+	email_crew = EmailFilterCrew(api_resource=None)
+	email_crew.crew.verbose = False
+	llm = StubLLM()
+	for agent in email_crew.crew.agents:
+		agent.llm = llm
+		agent.verbose = False
+
+	# Warm up crewAI's lazy imports and caches before timing either variant
+	time_runs(reused(email_crew), 1, args.emails)
+	rebuilt_timings = time_runs(rebuilt(email_crew), args.runs, args.emails)
+	reused_timings = time_runs(reused(email_crew), args.runs, args.emails)
+
+	print(f"{args.runs} runs of {args.emails} emails each")
+	report("rebuilt per run", rebuilt_timings)
+	report("reused crew", reused_timings)
+	saved = 1 - statistics.median(reused_timings) / statistics.median(rebuilt_timings)
+	print(f"Overhead saved per run: {saved:.0%}")
+
+if __name__ == "__main__":
+	main()
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+Simulate months of inbox polling against the checked-email index.
+
+Emails arrive at a steady rate and every poll searches the last day, like
+Nodes.check_email. SeenEmails runs every poll of the simulation. The list
+the nodes used before is only timed at each checkpoint, against every id
+seen so far held once, a lower bound on the real list, which was extended
+with the whole search result on every poll. Run from the project root:
+
+	python -m scripts.simulate_seen_emails --days 90 --emails-per-day 500
+"""
+import argparse
+import time
+
+from src.seen_emails import SeenEmails
+
+DAY = 24 * 3600
+SEARCH_WINDOW = DAY
+
+def message_id(number):
+	return f"{number:016x}"
+
+def time_poll(checked, results):
+	started_at = time.perf_counter()
+	new_emails = [email_id for email_id in results if email_id not in checked]
+	return time.perf_counter() - started_at, len(new_emails)
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+	parser.add_argument("--days", type=int, default=90)
+	parser.add_argument("--emails-per-day", type=int, default=500)
+	parser.add_argument("--poll-seconds", type=int, default=180)
+	parser.add_argument("--checkpoints", type=int, nargs="+", default=[1, 7, 30, 60, 90])
+	args = parser.parse_args()
+
+	seconds_per_email = DAY / args.emails_per_day
+	seen = SeenEmails()
+	list_length = 0
+	checkpoints = sorted(day for day in args.checkpoints if day <= args.days)
+	print(f"{args.emails_per_day} emails a day, a poll every {args.poll_seconds}s")
+	for now in range(args.poll_seconds, args.days * DAY + 1, args.poll_seconds):
+		newest = int(now / seconds_per_email)
+		oldest = max(0, int((now - SEARCH_WINDOW) / seconds_per_email))
+		results = [message_id(number) for number in range(oldest, newest)]
+
+		if checkpoints and now >= checkpoints[0] * DAY:
+			day = checkpoints.pop(0)
+			seen_ids = [message_id(number) for number in range(newest)]
+			list_time, _ = time_poll(seen_ids, results)
+			seen_time, new_count = time_poll(seen, results)
+			print(
+				f"day {day:>3}: list {list_length:>10,} ids, {list_time * 1000:8.1f} ms (at least)"
+				f" | SeenEmails {len(seen):>6,} ids, {seen_time * 1000:5.2f} ms"
+				f" | {new_count} new"
+			)
+
+		seen.add(results, now=now)
+		list_length += len(results)
+
+if __name__ == "__main__":
+	main()
\ No newline at end of file
@@ -1,4 +1,3 @@
-from langchain_community.agent_toolkits import GmailToolkit
 from langchain_community.tools.gmail.get_thread import GmailGetThread
 from langchain_community.tools.tavily_search import TavilySearchResults
 
@@ -7,8 +6,8 @@ from crewai import Agent
 from .tools import CreateDraftTool
 
 class EmailFilterAgents():
-	def __init__(self):
-		self.gmail = GmailToolkit()
+	def __init__(self, api_resource):
+		self.api_resource = api_resource
 
 	def email_filter_agent(self):
 		return Agent(
@@ -33,7 +32,7 @@ class EmailFilterAgents():
 				in identifying emails that require immediate action. Your skill set includes interpreting
 				the urgency and importance of an email based on its content and context."""),
 			tools=[
-				GmailGetThread(api_resource=self.gmail.api_resource),
+				GmailGetThread(api_resource=self.api_resource),
 				TavilySearchResults()
 			],
 			verbose=True,
@@ -50,8 +49,8 @@ class EmailFilterAgents():
 				tailored to address the specific needs and context of the email."""),
 			tools=[
 				TavilySearchResults(),
-				GmailGetThread(api_resource=self.gmail.api_resource),
-				CreateDraftTool.create_draft
+				GmailGetThread(api_resource=self.api_resource),
+				CreateDraftTool.for_mailbox(self.api_resource)
 			],
 			verbose=True,
 			allow_delegation=False,
@@ -1,34 +1,41 @@
+import asyncio
+
 from crewai import Crew
 
 from .agents import EmailFilterAgents
 from .tasks import EmailFilterTasks
 
 class EmailFilterCrew():
-	def __init__(self):
-		agents = EmailFilterAgents()
+	def __init__(self, api_resource):
+		agents = EmailFilterAgents(api_resource)
 		self.filter_agent = agents.email_filter_agent()
 		self.action_agent = agents.email_action_agent()
 		self.writer_agent = agents.email_response_writer()
 
-	def kickoff(self, state):
-		print("### Filtering emails")
+		# Built once and reused by every run of the graph, each kickoff only
+		# interpolates the new emails into the task templates
 		tasks = EmailFilterTasks()
-		crew = Crew(
+		self.crew = Crew(
 			agents=[self.filter_agent, self.action_agent, self.writer_agent],
 			tasks=[
-				tasks.filter_emails_task(self.filter_agent, self._format_emails(state['emails'])),
+				tasks.filter_emails_task(self.filter_agent),
 				tasks.action_required_emails_task(self.action_agent),
 				tasks.draft_responses_task(self.writer_agent)
 			],
 			verbose=True
 		)
-		result = crew.kickoff()
+
+	def kickoff(self, state):
+		print(f"### Filtering {len(state['emails'])} emails")
+		result = self.crew.kickoff(inputs={"emails": self._format_emails(state['emails'])})
 		return {**state, "action_required_emails": result}
 
+	async def kickoff_async(self, state):
+		return await asyncio.to_thread(self.kickoff, state)
+
 	def _format_emails(self, emails):
 		emails_string = []
 		for email in emails:
-			print(email)
 			arr = [
 				f"ID: {email['id']}",
 				f"- Thread ID: {email['threadId']}",
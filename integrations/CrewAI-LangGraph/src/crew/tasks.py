@@ -2,9 +2,10 @@ from crewai import Task
 from textwrap import dedent
 
 class EmailFilterTasks:
-	def filter_emails_task(self, agent, emails):
+	def filter_emails_task(self, agent):
+		# {emails} is filled in from the crew's kickoff inputs on every run
 		return Task(
-			description=dedent(f"""\
+			description=dedent("""\
 				Analyze a batch of emails and filter out
 				non-essential ones such as newsletters, promotional content and notifications.
 
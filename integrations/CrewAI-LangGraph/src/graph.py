@@ -7,24 +7,55 @@ from .state import EmailsState
 from .nodes import Nodes
 from .crew.crew import EmailFilterCrew
 
+def build_graph(check_email, draft_responses, wait_next_run, new_emails):
+	"""
+	Wire the nodes into the email graph, shared by the sync and async graphs
+	so they can only differ in the callables they run.
+	"""
+	workflow = StateGraph(EmailsState)
+
+	workflow.add_node("check_new_emails", check_email)
+	workflow.add_node("wait_next_run", wait_next_run)
+	workflow.add_node("draft_responses", draft_responses)
+
+	workflow.set_entry_point("check_new_emails")
+	workflow.add_conditional_edges(
+			"check_new_emails",
+			new_emails,
+			{
+				"continue": 'draft_responses',
+				"end": 'wait_next_run'
+			}
+	)
+	workflow.add_edge('draft_responses', 'wait_next_run')
+	workflow.add_edge('wait_next_run', 'check_new_emails')
+	return workflow.compile()
+
 class WorkFlow():
-	def __init__(self):
-		nodes = Nodes()
-		workflow = StateGraph(EmailsState)
-
-		workflow.add_node("check_new_emails", nodes.check_email)
-		workflow.add_node("wait_next_run", nodes.wait_next_run)
-		workflow.add_node("draft_responses", EmailFilterCrew().kickoff)
-
-		workflow.set_entry_point("check_new_emails")
-		workflow.add_conditional_edges(
-				"check_new_emails",
-				nodes.new_emails,
-				{
-					"continue": 'draft_responses',
-					"end": 'wait_next_run'
-				}
+	def __init__(self, my_email, token_file="token.json", client_secrets_file="credentials.json"):
+		nodes = Nodes(my_email, token_file, client_secrets_file)
+		crew = EmailFilterCrew(nodes.gmail.api_resource)
+		self.app = build_graph(
+			nodes.check_email,
+			crew.kickoff,
+			nodes.wait_next_run,
+			nodes.new_emails
 		)
-		workflow.add_edge('draft_responses', 'wait_next_run')
-		workflow.add_edge('wait_next_run', 'check_new_emails')
-		self.app = workflow.compile()
\ No newline at end of file
+
+class AsyncWorkFlow():
+	"""
+	Same graph as WorkFlow with async nodes, run with `app.ainvoke`.
+
+	Waiting between checks doesn't hold a thread, so one process can run a
+	graph per mailbox on a single event loop, each one built with the
+	address and OAuth files of its own mailbox.
+	"""
+	def __init__(self, my_email, token_file="token.json", client_secrets_file="credentials.json"):
+		nodes = Nodes(my_email, token_file, client_secrets_file)
+		crew = EmailFilterCrew(nodes.gmail.api_resource)
+		self.app = build_graph(
+			nodes.check_email_async,
+			crew.kickoff_async,
+			nodes.wait_next_run_async,
+			nodes.new_emails
+		)
\ No newline at end of file
@@ -1,23 +1,33 @@
-import os
+import asyncio
 import time
 
 from langchain_community.agent_toolkits import GmailToolkit
 from langchain_community.tools.gmail.search import GmailSearch
+from langchain_community.tools.gmail.utils import build_resource_service, get_gmail_credentials
+
+from .seen_emails import SeenEmails
 
 class Nodes():
-	def __init__(self):
-		self.gmail = GmailToolkit()
+	def __init__(self, my_email, token_file="token.json", client_secrets_file="credentials.json"):
+		# Each mailbox authorizes with its own token, so several graphs can
+		# run side by side for different accounts
+		credentials = get_gmail_credentials(
+			token_file=token_file,
+			client_secrets_file=client_secrets_file
+		)
+		self.gmail = GmailToolkit(api_resource=build_resource_service(credentials=credentials))
+		self.my_email = my_email
+		self.checked_emails = SeenEmails()
 
 	def check_email(self, state):
 		print("# Checking for new emails")
 		search = GmailSearch(api_resource=self.gmail.api_resource)
 		emails = search('after:newer_than:1d')
-		checked_emails = state['checked_emails_ids'] if state['checked_emails_ids'] else []
-		thread = []
+		thread = set()
 		new_emails = []
 		for email in emails:
-			if (email['id'] not in checked_emails) and (email['threadId'] not in thread) and ( os.environ['MY_EMAIL'] not in email['sender']):
-				thread.append(email['threadId'])
+			if (email['id'] not in self.checked_emails) and (email['threadId'] not in thread) and (self.my_email not in email['sender']):
+				thread.add(email['threadId'])
 				new_emails.append(
 					{
 						"id": email['id'],
@@ -26,11 +36,10 @@ class Nodes():
 						"sender": email["sender"]
 					}
 				)
-		checked_emails.extend([email['id'] for email in emails])
+		self.checked_emails.add([email['id'] for email in emails])
 		return {
 			**state,
-			"emails": new_emails,
-			"checked_emails_ids": checked_emails
+			"emails": new_emails
 		}
 
 	def wait_next_run(self, state):
@@ -38,6 +47,16 @@ class Nodes():
 		time.sleep(180)
 		return state
 
+	async def check_email_async(self, state):
+		# The Gmail client is blocking, run it off the event loop
+		return await asyncio.to_thread(self.check_email, state)
+
+	async def wait_next_run_async(self, state):
+		# A timer on the event loop, no thread is held while waiting
+		print("## Waiting for 180 seconds")
+		await asyncio.sleep(180)
+		return state
+
 	def new_emails(self, state):
 		if len(state['emails']) == 0:
 			print("## No new emails")
@@ -0,0 +1,39 @@
+import time
+from collections import OrderedDict
+
+class SeenEmails():
+	"""
+	Ids of the emails already checked, with O(1) membership tests.
+
+	Ids are forgotten `max_age` seconds after they were last seen, and the
+	oldest ones are dropped beyond `max_size` ids, so memory and the cost of
+	a poll stay bounded however long the graph runs. Ids still returned by
+	the inbox search are refreshed on every poll, so `max_age` only has to
+	be longer than the search window.
+	"""
+	def __init__(self, max_age=3 * 24 * 3600, max_size=100_000):
+		self.max_age = max_age
+		self.max_size = max_size
+		self._seen = OrderedDict()
+
+	def __contains__(self, email_id):
+		return email_id in self._seen
+
+	def __len__(self):
+		return len(self._seen)
+
+	def add(self, email_ids, now=None):
+		now = time.time() if now is None else now
+		for email_id in email_ids:
+			self._seen[email_id] = now
+			self._seen.move_to_end(email_id)
+		self._expire(now)
+
+	def _expire(self, now):
+		# Ids are kept in the order they were last seen, oldest first
+		expires_before = now - self.max_age
+		while self._seen:
+			seen_at = next(iter(self._seen.values()))
+			if seen_at >= expires_before and len(self._seen) <= self.max_size:
+				break
+			self._seen.popitem(last=False)
\ No newline at end of file
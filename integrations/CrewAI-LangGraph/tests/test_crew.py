@@ -0,0 +1,66 @@
+import os
+from functools import partial
+
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+from crewai import Task
+from crewai.llms.base_llm import BaseLLM
+from crewai.tools import BaseTool
+
+from src.crew import agents, tasks
+from src.crew.crew import EmailFilterCrew
+
+class PromptRecorder(BaseLLM):
+	"""Keeps every prompt it is sent and answers straight away."""
+	def __init__(self):
+		super().__init__(model="stub")
+		self.prompts = []
+
+	def call(self, messages, *args, **kwargs):
+		if isinstance(messages, str):
+			messages = [{"role": "user", "content": messages}]
+		self.prompts.append("\n".join(message["content"] for message in messages))
+		return "Thought: I now can give a great answer\nFinal Answer: done"
+
+	def supports_function_calling(self):
+		return False
+
+class StubTool(BaseTool):
+	name: str = "Stub Tool"
+	description: str = "Never called, the stub LLM answers straight away."
+
+	def _run(self, *args, **kwargs):
+		return ""
+
+def email(email_id):
+	return {
+		"id": email_id,
+		"threadId": f"thread-{email_id}",
+		"snippet": f"Snippet of {email_id}",
+		"sender": f"{email_id}@example.com"
+	}
+
+def test_each_kickoff_interpolates_its_own_emails(monkeypatch):
+	# The agents and tasks were written for an older crewAI, which took
+	# LangChain tools and did not require an expected output
+	monkeypatch.setattr(agents, "GmailGetThread", lambda **kwargs: StubTool())
+	monkeypatch.setattr(agents, "TavilySearchResults", lambda **kwargs: StubTool())
+	monkeypatch.setattr(agents.CreateDraftTool, "for_mailbox", staticmethod(lambda api_resource: StubTool()))
+	monkeypatch.setattr(tasks, "Task", partial(Task, expected_output="The answer"))
+	crew = EmailFilterCrew(api_resource=None)
+	llm = PromptRecorder()
+	for agent in crew.crew.agents:
+		agent.llm = llm
+
+	first_prompts = []
+	for email_id in ["first-email", "second-email"]:
+		llm.prompts.clear()
+		crew.kickoff({"emails": [email(email_id)]})
+		first_prompts.append(llm.prompts[0])
+
+	first_run, second_run = first_prompts
+	assert "ID: first-email" in first_run
+	assert "ID: second-email" not in first_run
+	assert "ID: second-email" in second_run
+	assert "ID: first-email" not in second_run
\ No newline at end of file